@@ -0,0 +1,64 @@
+"""
+Contagem de modelos com o logic.sat (componentes e cache) em fórmulas estruturadas com 60 variáveis ou mais,
+onde a tabela verdade teria 2^n linhas. O resultado é conferido com o BDD.
+
+Uso (a partir de src): python -m benchmarks.count [variáveis]
+"""
+
+import random
+import sys
+import time
+
+from logic import bdd, sat
+from logic.model import Expression
+from logic.model.operands import VAR
+from logic.model.operators import AND, OR, NOT, IMPLY, XOR
+
+
+def chain(length: int) -> Expression:
+    """x0 → x1 → ... : n + 1 modelos, tudo em um único componente."""
+    return AND(*(IMPLY(VAR(f"x{i}"), VAR(f"x{i + 1}")) for i in range(length - 1)))
+
+
+def blocks(length: int, size: int = 6) -> Expression:
+    """Blocos independentes de cláusulas aleatórias; cada bloco vira um componente."""
+    terms: list[Expression] = []
+    for start in range(0, length, size):
+        names: list[str] = [f"x{i}" for i in range(start, min(start + size, length))]
+        for _ in range(size // 2 + 1):
+            literals = [VAR(name) for name in random.sample(names, min(3, len(names)))]
+            terms.append(OR(*(NOT(lit) if random.random() < 0.5 else lit for lit in literals)))
+    return AND(*terms)
+
+
+def ladder(length: int) -> Expression:
+    """Pares vizinhos ligados por XOR e implicações: componentes surgem depois de cada decisão."""
+    terms: list[Expression] = []
+    for i in range(0, length - 2, 2):
+        terms.append(OR(XOR(VAR(f"x{i}"), VAR(f"x{i + 1}")), VAR(f"x{i + 2}")))
+        terms.append(IMPLY(VAR(f"x{i + 1}"), OR(VAR(f"x{i + 2}"), VAR(f"x{i + 3}"))))
+    return AND(*terms)
+
+
+def main() -> None:
+    length: int = int(sys.argv[1]) if len(sys.argv) > 1 else 80
+
+    random.seed(0)
+    print(f"{'fórmula':>8} {'vars':>5} {'modelos':>26} {'sat (s)':>8} {'bdd (s)':>8} {'correto':>8}")
+    for name, family in (("cadeia", chain), ("blocos", blocks), ("escada", ladder)):
+        expr: Expression = family(length)
+
+        start: float = time.perf_counter()
+        count: int = sat.count_models(expr)
+        count_time: float = time.perf_counter() - start
+
+        start = time.perf_counter()
+        expected: int = bdd.count_models(expr)
+        bdd_time: float = time.perf_counter() - start
+
+        print(f"{name:>8} {len(expr.variables()):>5} {count:>26} {count_time:>8.3f} {bdd_time:>8.3f} "
+              f"{str(count == expected):>8}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,45 @@
+"""
+Tamanho e tempo de to_cnf em cadeias de XOR, cuja CNF exata tem 2^(n-1) cláusulas.
+Compara a conversão exata com a de limite, que passa para a codificação de Tseitin (linear).
+
+Uso (a partir de src): python -m benchmarks.forms [variáveis máximas] [limite]
+"""
+
+import sys
+import time
+
+from logic.forms import to_cnf, NormalForm
+from logic.model import Expression
+from logic.model.operands import VAR
+from logic.model.operators import XOR
+
+
+def xor_chain(length: int) -> Expression:
+    expr: Expression = VAR("x0")
+    for i in range(1, length):
+        expr = XOR(expr, VAR(f"x{i}"))
+    return expr
+
+
+def main() -> None:
+    high: int = int(sys.argv[1]) if len(sys.argv) > 1 else 16
+    limit: int = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+
+    print(f"{'vars':>4} {'exata':>8} {'literais':>9} {'tempo (s)':>9} {'limite':>8} {'literais':>9} {'tempo (s)':>9}")
+    for length in range(2, high + 1, 2):
+        expr: Expression = xor_chain(length)
+
+        start: float = time.perf_counter()
+        exact: NormalForm = to_cnf(expr)
+        exact_time: float = time.perf_counter() - start
+
+        start = time.perf_counter()
+        capped: NormalForm = to_cnf(expr, limit=limit)
+        capped_time: float = time.perf_counter() - start
+
+        print(f"{length:>4} {len(exact):>8} {exact.size():>9} {exact_time:>9.4f} "
+              f"{len(capped):>8} {capped.size():>9} {capped_time:>9.4f}")
+
+
+if __name__ == '__main__':
+    main()
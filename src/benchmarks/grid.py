@@ -0,0 +1,62 @@
+"""
+Tempo e pico de memória para desenhar a tabela verdade no formato fancy_grid.
+Compara o tabulate (tabela inteira em memória, larguras calculadas célula a célula) com TruthTable.write_grid,
+que escreve linha a linha. A saída vai para /dev/null; as duas são conferidas em uma tabela pequena.
+
+Uso (a partir de src): python -m benchmarks.grid [variáveis mínimas] [variáveis máximas]
+"""
+
+import io
+import os
+import sys
+import time
+import tracemalloc
+
+from logic.calculator.parser import LogicParser
+from logic.calculator.table import TruthTable, tabulate
+
+
+def formula(length: int) -> str:
+    return " ∨ ".join(f"(x{i:02} ∧ ¬x{(i + 1) % length:02})" for i in range(length))
+
+
+def measure(function) -> tuple[float, float]:
+    """Tempo em segundos e pico de memória em MB."""
+    tracemalloc.start()
+    start: float = time.perf_counter()
+    function()
+    elapsed: float = time.perf_counter() - start
+    peak: int = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak / 2 ** 20
+
+
+def main() -> None:
+    low: int = int(sys.argv[1]) if len(sys.argv) > 1 else 12
+    high: int = int(sys.argv[2]) if len(sys.argv) > 2 else 16
+
+    parser: LogicParser = LogicParser(formula(6))
+    parser.parse()
+    small: TruthTable = parser.get_table()
+    grid, reference = io.StringIO(), io.StringIO()
+    small.write_grid(grid)
+    small.show(reference, use_tabulate=True)
+    print(f"Saída igual ao tabulate: {grid.getvalue() == reference.getvalue()}")
+
+    print(f"{'vars':>4} {'linhas':>7} {'tabulate (s)':>12} {'MB':>7} {'write_grid (s)':>14} {'MB':>7}")
+    with open(os.devnull, "w", encoding="utf-8") as sink:
+        for length in range(low, high + 1, 2):
+            parser.expr = formula(length)
+            parser.parse()
+            table: TruthTable = parser.get_table()
+            if tabulate is not None:
+                tabulate_time, tabulate_memory = measure(lambda: table.show(sink, use_tabulate=True))
+            else:
+                tabulate_time = tabulate_memory = float("nan")
+            grid_time, grid_memory = measure(lambda: table.write_grid(sink))
+            print(f"{length:>4} {2 ** length:>7} {tabulate_time:>12.2f} {tabulate_memory:>7.1f} "
+                  f"{grid_time:>14.3f} {grid_memory:>7.1f}")
+
+
+if __name__ == '__main__':
+    main()
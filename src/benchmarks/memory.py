@@ -0,0 +1,78 @@
+"""
+Memória ocupada por operador de uma fórmula grande e por token, medida com tracemalloc.
+A fórmula é uma cadeia com parênteses à esquerda só com as variáveis p, q e r, sem subárvores repetidas:
+o hash-consing não economiza nada nela, então o resultado é o custo de cada nó com sua entrada na tabela.
+Usa só os construtores dos nós, LogicParser e tokenize, então também roda em versões anteriores para comparar.
+
+Uso (a partir de src): python -m benchmarks.memory [operadores]
+"""
+
+import gc
+import sys
+import tracemalloc
+from typing import Callable
+
+from logic.calculator.parser import LogicParser
+from logic.calculator.setup import tokenize
+from logic.model.operands import VAR
+from logic.model.operators import AND, IMPLY, NOT, OR, XOR
+
+OPERATORS: tuple = (AND, IMPLY, OR, XOR)
+SYMBOLS: tuple = ("∧", "→", "∨", "⊕")
+
+
+def build_formula(size: int):
+    """((p ∧ ¬p) → q) ∨ ¬r ... com size operadores binários, montada pelos construtores."""
+    expr = VAR("p")
+    for i in range(size):
+        var = VAR("pqr"[i % 3])
+        expr = OPERATORS[i % len(OPERATORS)](expr, NOT(var) if i % 2 == 0 else var)
+    return expr
+
+
+def formula_text(size: int) -> str:
+    """A mesma fórmula de build_formula, como texto."""
+    parts: list[str] = ["(" * size, "p"]
+    for i in range(size):
+        var: str = "pqr"[i % 3]
+        parts.append(f" {SYMBOLS[i % len(SYMBOLS)]} {'¬' + var if i % 2 == 0 else var})")
+    return "".join(parts)
+
+
+def parse_formula(text: str):
+    parser: LogicParser = LogicParser(text, simplify_expression=False)
+    parser.parse()
+    return parser.expression
+
+
+def measure(build: Callable[[], object]) -> int:
+    """Bytes ainda alocados para o objeto construído. O objeto é descartado depois, assim as medidas seguintes não o reaproveitam."""
+    gc.collect()
+    tracemalloc.start()
+    before: int = tracemalloc.get_traced_memory()[0]
+    result = build()
+    gc.collect()
+    after: int = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    gc.collect()
+    return after - before
+
+
+def main() -> None:
+    size: int = int(sys.argv[1]) if len(sys.argv) > 1 else 10 ** 5
+    text: str = formula_text(size)
+    tokens: int = len(tokenize(text))
+
+    built: int = measure(lambda: build_formula(size))
+    parsed: int = measure(lambda: parse_formula(text))
+    scanned: int = measure(lambda: tokenize(text))
+
+    print(f"{'objeto':<24} {'quantidade':>10} {'bytes/objeto':>13}")
+    print(f"{'fórmula (construtores)':<24} {size:>10} {built / size:>13.1f}")
+    print(f"{'fórmula (LogicParser)':<24} {size:>10} {parsed / size:>13.1f}")
+    print(f"{'token':<24} {tokens:>10} {scanned / tokens:>13.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+"""
+Desempenho do minimizador em funções aleatórias de 4 a 16 variáveis.
+Cada resultado é conferido contra a função original.
+
+Uso (a partir de src): python -m benchmarks.minimize [variáveis mínimas] [variáveis máximas]
+"""
+
+import random
+import sys
+import time
+
+from logic.calculator.minimizer import EXACT_LIMIT, minimize_minterms, to_expression
+from logic.calculator.table import gen_bit_variables
+
+
+def random_function(length: int, density: float) -> int:
+    """Gera o conjunto de mintermos (empacotado) de uma função aleatória."""
+    on: int = 0
+    for i in range(1 << length):
+        if random.random() < density:
+            on |= 1 << i
+    return on
+
+
+def main() -> None:
+    low: int = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    high: int = int(sys.argv[2]) if len(sys.argv) > 2 else 16
+
+    random.seed(0)
+    print(f"{'vars':>4} {'método':>8} {'densidade':>9} {'tempo (s)':>10} {'termos':>7} {'literais':>9} {'correto':>8}")
+    for length in range(low, high + 1):
+        names: list[str] = [f"x{i:02d}" for i in range(length)]
+        bits, mask = gen_bit_variables(dict.fromkeys(names, True))
+        for density in (0.25, 0.5):
+            on: int = random_function(length, density)
+            exact: bool = length <= EXACT_LIMIT
+
+            start: float = time.perf_counter()
+            cubes = minimize_minterms([i for i in range(1 << length) if on >> i & 1], length, exact=exact)
+            elapsed: float = time.perf_counter() - start
+
+            result = to_expression(cubes, names)
+            correct: bool = result.evaluate_bits(bits, mask) == on
+            literals: int = sum(length - bin(m).count("1") for _, m in cubes)
+            method: str = "exato" if exact else "espresso"
+            print(f"{length:>4} {method:>8} {density:>9.2f} {elapsed:>10.3f} {len(cubes):>7} {literals:>9} {str(correct):>8}", flush=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+"""
+Teste de estresse do parse concorrente.
+Várias threads fazem o parse e a simplificação das mesmas fórmulas, sem o cache de parse, e os resultados são comparados com a execução serial.
+
+Uso (a partir de src): python -m benchmarks.parse_threads [fórmulas] [threads máximas]
+"""
+
+import random
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from logic.calculator.parser import LogicParser
+
+operators: list[str] = ['∧', '∨', '→', '⟷', '⊻', '↑', '↓']
+
+
+def random_formula(depth: int) -> str:
+    """Gera uma fórmula aleatória com as variáveis p, q e r."""
+    if depth == 0 or random.random() < 0.2:
+        return random.choice(['p', 'q', 'r', '¬p', '¬q', '¬r'])
+    return f"({random_formula(depth - 1)} {random.choice(operators)} {random_formula(depth - 1)})"
+
+
+def parse(expr: str) -> str:
+    """
+    Faz o parse e a simplificação com um LogicParser próprio e retorna a fórmula resultante.
+    Sem o cache de parse: cada execução precisa passar pelo estado compartilhado da simplificação.
+    """
+    parser: LogicParser = LogicParser(expr, use_cache=False)
+    parser.parse()
+    return parser.expression.stringify()
+
+
+def run(formulas: list[str], workers: int) -> tuple[list[str], float]:
+    """Faz o parse de todas as fórmulas com o número de threads indicado. Retorna os resultados e o tempo."""
+    start: float = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results: list[str] = list(executor.map(parse, formulas, chunksize=64))
+    return results, time.perf_counter() - start
+
+
+def main() -> None:
+    count: int = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    max_workers: int = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+
+    random.seed(0)
+    formulas: list[str] = [random_formula(6) for _ in range(count)]
+    expected: list[str] = [parse(expr) for expr in formulas]
+
+    print(f"{'threads':>8} {'tempo (s)':>10} {'fórmulas/s':>12} {'corretos':>9}")
+    workers: int = 1
+    while workers <= max_workers:
+        results, elapsed = run(formulas, workers)
+        print(f"{workers:>8} {elapsed:>10.3f} {count / elapsed:>12.0f} {str(results == expected):>9}")
+        workers *= 2
+
+
+if __name__ == '__main__':
+    main()
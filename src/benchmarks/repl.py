@@ -0,0 +1,78 @@
+"""
+Tempo de resposta do REPL para fórmulas de 16 variáveis, digitadas aos poucos.
+Compara o caminho completo (parse, tokenização e coluna da tabela inteiros) com logic.calculator.session,
+que retokeniza só o trecho editado e reaproveita a coluna das subárvores que não mudaram.
+
+Uso (a partir de src): python -m benchmarks.repl [variáveis]
+"""
+
+import statistics
+import sys
+import time
+
+from logic.calculator.parser import LogicParser
+from logic.calculator.session import Session
+from logic.calculator.table import gen_bit_variables
+
+OPERATORS: tuple = ("∧", "∨", "→", "⊕", "⟷")
+
+
+def edits(length: int) -> list[tuple[str, str]]:
+    """
+    Linhas digitadas, com o tipo de edição: acrescenta um termo (e uma variável) por vez ao fim da fórmula
+    e depois troca operadores e variáveis no meio dela.
+    """
+    terms: list[str] = [f"(x{i:02} {OPERATORS[i % len(OPERATORS)]} ¬x{(i + 1) % length:02})" for i in range(length)]
+    lines: list[tuple[str, str]] = []
+    text: str = terms[0]
+    for i, term in enumerate(terms[1:], 1):
+        text = f"{text} {OPERATORS[i % 2]} {term}"
+        lines.append(("acréscimo", text))
+    for i in range(length):
+        old: str = f"x{i:02} {OPERATORS[i % len(OPERATORS)]}"
+        text = text.replace(old, f"x{i:02} {OPERATORS[(i + 1) % len(OPERATORS)]}")
+        lines.append(("meio", text))
+        text = text.replace(old.split()[0] + " ", f"x{(i + 2) % length:02} ", 1)
+        lines.append(("meio", text))
+    return lines
+
+
+def full(text: str) -> int:
+    parser: LogicParser = LogicParser(text, simplify_expression=False, use_cache=False)
+    parser.parse()
+    bits, mask = gen_bit_variables(parser.variables)
+    return parser.expression.evaluate_bits(bits, mask)
+
+
+def main() -> None:
+    length: int = int(sys.argv[1]) if len(sys.argv) > 1 else 16
+    lines: list[tuple[str, str]] = edits(length)
+
+    full_times: list[float] = []
+    expected: list[int] = []
+    for _, text in lines:
+        start: float = time.perf_counter()
+        expected.append(full(text))
+        full_times.append(time.perf_counter() - start)
+
+    session: Session = Session()
+    session_times: list[float] = []
+    correct: bool = True
+    for (_, text), column in zip(lines, expected):
+        start = time.perf_counter()
+        session.update(text)
+        session_times.append(time.perf_counter() - start)
+        correct = correct and session.column == column
+
+    print(f"{len(lines)} linhas, até {length} variáveis; tempo por linha em ms")
+    print(f"{'edição':>10} {'':>10} {'mediana':>8} {'p90':>8} {'máximo':>8}")
+    for kind in ("acréscimo", "meio"):
+        for name, times in (("completo", full_times), ("sessão", session_times)):
+            times = sorted(t * 1000 for (edit, _), t in zip(lines, times) if edit == kind)
+            print(f"{kind:>10} {name:>10} {statistics.median(times):>8.2f} {times[len(times) * 9 // 10]:>8.2f} "
+                  f"{times[-1]:>8.2f}")
+    print(f"Colunas iguais: {correct}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+"""
+Desempenho do logic.sat em instâncias aleatórias de 3-SAT.
+Cada instância vira uma Expression (∧ de ∨ de literais), é codificada por Tseitin e resolvida pelo CDCL.
+Os modelos encontrados são conferidos com evaluate.
+
+Uso (a partir de src): python -m benchmarks.sat [variáveis mínimas] [variáveis máximas] [razão cláusulas/variáveis] [instâncias]
+"""
+
+import random
+import statistics
+import sys
+import time
+
+from logic.model import Expression
+from logic.model.operands import VAR
+from logic.model.operators import AND, NOT, OR
+from logic.sat import Solver, tseitin
+
+
+def random_3sat(length: int, clauses: int) -> Expression:
+    """Conjunção de cláusulas com três variáveis distintas, cada uma negada com probabilidade 1/2."""
+    names: list[str] = [f"x{i}" for i in range(length)]
+    terms: list[Expression] = []
+    for _ in range(clauses):
+        literals: list[Expression] = [VAR(name) for name in random.sample(names, 3)]
+        terms.append(OR(*(NOT(lit) if random.random() < 0.5 else lit for lit in literals)))
+    return AND(*terms)
+
+
+def main() -> None:
+    low: int = int(sys.argv[1]) if len(sys.argv) > 1 else 25
+    high: int = int(sys.argv[2]) if len(sys.argv) > 2 else 150
+    ratio: float = float(sys.argv[3]) if len(sys.argv) > 3 else 4.26
+    instances: int = int(sys.argv[4]) if len(sys.argv) > 4 else 5
+
+    random.seed(0)
+    print(f"{'vars':>4} {'cláusulas':>9} {'sat':>5} {'tseitin (s)':>11} {'mediana (s)':>11} {'máximo (s)':>10} "
+          f"{'conflitos':>9} {'correto':>8}")
+    for length in range(low, high + 1, 25):
+        clauses: int = round(ratio * length)
+        encode_times: list[float] = []
+        solve_times: list[float] = []
+        conflicts: list[int] = []
+        satisfiable: int = 0
+        correct: bool = True
+        for _ in range(instances):
+            expr: Expression = random_3sat(length, clauses)
+
+            start: float = time.perf_counter()
+            cnf = tseitin(expr)
+            encode_times.append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            solver: Solver = Solver(cnf.count, cnf.clauses)
+            result: bool = solver.solve()
+            solve_times.append(time.perf_counter() - start)
+            conflicts.append(solver.conflicts)
+
+            if result:
+                satisfiable += 1
+                correct = correct and expr.evaluate(cnf.assignment(solver.model())) is True
+
+        print(f"{length:>4} {clauses:>9} {satisfiable:>2}/{instances:<2} {statistics.mean(encode_times):>11.4f} "
+              f"{statistics.median(solve_times):>11.3f} {max(solve_times):>10.3f} {round(statistics.mean(conflicts)):>9} "
+              f"{str(correct):>8}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+"""
+Desempenho do tokenizador em entradas de 1 MB.
+Mede uma entrada só com símbolos, uma com palavras reservadas e identificadores longos e uma mistura das duas.
+
+Uso (a partir de src): python -m benchmarks.tokenize [tamanho em bytes] [repetições]
+"""
+
+import random
+import sys
+import time
+
+from logic.calculator.setup import tokenize
+
+SAMPLES: dict[str, tuple[list[str], list[str]]] = {
+    "símbolos": (["p", "q", "r", "¬p", "~q"], ["&", "|", "->", "<->", "∧", "∨", "⊕"]),
+    "palavras": (["en_42", "ready_q", "valid_in", "NOT busy"], ["AND", "OR", "IMPLIES", "XOR", "NAND"]),
+    "mistura": (["p", "en_42", "¬ready_q", "(q & r)", "1"], ["&&", "OU", "→", "v", "NOR"]),
+}
+
+
+def generate(size: int, operands: list[str], operators: list[str]) -> str:
+    """Fórmula aleatória com pelo menos size bytes em UTF-8."""
+    parts: list[str] = [random.choice(operands)]
+    length: int = len(parts[0])
+    while length < size:
+        part: str = f" {random.choice(operators)} {random.choice(operands)}"
+        parts.append(part)
+        length += len(part.encode())
+    return "".join(parts)
+
+
+def main() -> None:
+    size: int = int(sys.argv[1]) if len(sys.argv) > 1 else 2 ** 20
+    repeat: int = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+
+    random.seed(0)
+    print(f"{'entrada':<10} {'MB':>6} {'tokens':>9} {'tempo (s)':>10} {'MB/s':>7}")
+    for name, (operands, operators) in SAMPLES.items():
+        text: str = generate(size, operands, operators)
+        megabytes: float = len(text.encode()) / 2 ** 20
+
+        best: float = float("inf")
+        count: int = 0
+        for _ in range(repeat):
+            start: float = time.perf_counter()
+            count = len(tokenize(text))
+            best = min(best, time.perf_counter() - start)
+        print(f"{name:<10} {megabytes:>6.2f} {count:>9} {best:>10.3f} {megabytes / best:>7.2f}")
+
+
+if __name__ == '__main__':
+    main()
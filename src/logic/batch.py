@@ -0,0 +1,126 @@
+"""
+Parse em lote de arquivos de fórmulas, uma por linha.
+As fórmulas são distribuídas entre processos e os resultados saem na mesma ordem da entrada.
+
+Uso (a partir de src): python -m logic.batch formulas.txt [--workers N] [--chunksize N] [--normalize] [--no-simplify]
+Sem arquivo (ou com '-') as fórmulas são lidas da entrada padrão.
+"""
+
+import argparse
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Iterable, Iterator, Optional, TextIO
+
+from logic import bdd
+from logic.calculator.parser import LogicParser
+
+TAUTOLOGY: str = "tautologia"
+CONTRADICTION: str = "contradição"
+CONTINGENCY: str = "contingência"
+
+
+class BatchResult:
+    """Resultado de uma linha da entrada. Em caso de erro, formula e classification ficam vazias."""
+
+    def __init__(self, line: int, source: str, formula: str = "", canon: bool = False,
+                 classification: str = "", error: Optional[str] = None):
+        self.line: int = line
+        self.source: str = source
+        self.formula: str = formula
+        self.canon: bool = canon
+        self.classification: str = classification
+        self.error: Optional[str] = error
+
+    def is_valid(self) -> bool:
+        return self.error is None
+
+    def __repr__(self) -> str:
+        if self.error is not None:
+            return f"BatchResult({self.line}, {self.source!r}, error={self.error!r})"
+        return f"BatchResult({self.line}, {self.source!r}, {self.formula!r}, {self.classification})"
+
+
+def classify(parser: LogicParser) -> str:
+    """Classifica a fórmula já analisada em tautologia, contradição ou contingência."""
+    manager, u = bdd.build(parser.expression, parser.variables)
+    if u == manager.TRUE:
+        return TAUTOLOGY
+    if u == manager.FALSE:
+        return CONTRADICTION
+    return CONTINGENCY
+
+
+def process(item: tuple[int, str], normalize: bool = False, simplify: bool = True) -> BatchResult:
+    """
+    Faz o parse, simplifica e classifica uma fórmula. Qualquer erro vira parte do resultado da linha,
+    assim uma fórmula com problema não interrompe o resto do lote.
+    """
+    line, source = item
+    parser: LogicParser = LogicParser(source, normalize=normalize, simplify_expression=simplify)
+    try:
+        parser.parse()
+        return BatchResult(line, source, parser.expression.stringify(), parser.is_canon(), classify(parser))
+    except Exception as e:
+        return BatchResult(line, source, error=f"[{type(e).__name__}] {e}")
+
+
+def read_formulas(lines: Iterable[str]) -> Iterator[tuple[int, str]]:
+    """Numera as linhas da entrada, ignorando linhas vazias e comentários com '#'."""
+    for line, text in enumerate(lines, start=1):
+        text = text.strip()
+        if text and not text.startswith('#'):
+            yield line, text
+
+
+def run(formulas: Iterable[tuple[int, str]], *, workers: Optional[int] = None, chunksize: int = 64,
+        normalize: bool = False, simplify: bool = True) -> Iterator[BatchResult]:
+    """
+    Processa as fórmulas, preservando a ordem da entrada.
+    workers=1 executa no processo atual; caso contrário usa um ProcessPoolExecutor com lotes de chunksize fórmulas.
+    """
+    task = partial(process, normalize=normalize, simplify=simplify)
+    if workers == 1:
+        yield from map(task, formulas)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(task, formulas, chunksize=chunksize)
+
+
+def write_results(results: Iterable[BatchResult], file: TextIO) -> tuple[int, int]:
+    """Escreve uma linha separada por tabulação por resultado. Retorna a quantidade de válidas e de erros."""
+    valid: int = 0
+    errors: int = 0
+    for result in results:
+        if result.is_valid():
+            valid += 1
+            file.write(f"{result.line}\tok\t{result.classification}\t{'canônica' if result.canon else '-'}\t{result.formula}\n")
+        else:
+            errors += 1
+            file.write(f"{result.line}\terro\t{result.error}\t-\t{result.source}\n")
+    return valid, errors
+
+
+def main() -> None:
+    arguments = argparse.ArgumentParser(prog="python -m logic.batch", description="Parse em lote de fórmulas lógicas.")
+    arguments.add_argument("file", nargs="?", default="-", help="arquivo com uma fórmula por linha ('-' para stdin)")
+    arguments.add_argument("--workers", type=int, default=None, help="quantidade de processos (1 = sem processos)")
+    arguments.add_argument("--chunksize", type=int, default=64, help="fórmulas enviadas por vez a cada processo")
+    arguments.add_argument("--normalize", action="store_true", help="converte para a forma canônica")
+    arguments.add_argument("--no-simplify", dest="simplify", action="store_false", help="não simplifica as fórmulas")
+    args = arguments.parse_args()
+
+    source: TextIO = sys.stdin if args.file == "-" else open(args.file, encoding="utf-8")
+    try:
+        results: Iterator[BatchResult] = run(read_formulas(source), workers=args.workers, chunksize=args.chunksize,
+                                             normalize=args.normalize, simplify=args.simplify)
+        valid, errors = write_results(results, sys.stdout)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+    print(f"{valid} válidas, {errors} com erro", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
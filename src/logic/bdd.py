@@ -0,0 +1,226 @@
+"""
+Diagrama de decisão binária reduzido e ordenado (ROBDD).
+Responde tautologia, satisfatibilidade, equivalência e contagem de modelos em tempo proporcional ao tamanho do BDD.
+"""
+
+from __future__ import annotations
+
+from functools import reduce
+from typing import Callable, Optional
+
+from logic.model import Expression, Operator, postorder, operands
+from logic.model.operators import NOT, AND, OR, IMPLY, EQUAL, XOR, NAND, NOR
+
+ORDERS: tuple = ("appearance", "sorted")
+
+
+class BDD:
+    """
+    Gerenciador de nós. Cada nó é um inteiro; 0 e 1 são as folhas Falso e Verdade.
+    Nós iguais são únicos (tabela única) e os resultados do ITE ficam em cache.
+    """
+
+    FALSE: int = 0
+    TRUE: int = 1
+
+    def __init__(self, order: list[str]):
+        self.order: list[str] = list(order)
+        self.level: dict[str, int] = {var: i for i, var in enumerate(self.order)}
+
+        # Nós guardados em listas paralelas. As folhas ficam no nível após a última variável.
+        self.levels: list[int] = [len(self.order), len(self.order)]
+        self.lows: list[int] = [0, 1]
+        self.highs: list[int] = [0, 1]
+
+        self.unique: dict[tuple[int, int, int], int] = {}
+        self.computed: dict[tuple[int, int, int], int] = {}
+
+    def __len__(self) -> int:
+        return len(self.levels)
+
+    def node(self, level: int, low: int, high: int) -> int:
+        """Retorna o nó (level, low, high), reaproveitando um igual. Remove testes redundantes."""
+        if low == high:
+            return low
+        key: tuple[int, int, int] = (level, low, high)
+        found: Optional[int] = self.unique.get(key)
+        if found is None:
+            found = len(self.levels)
+            self.levels.append(level)
+            self.lows.append(low)
+            self.highs.append(high)
+            self.unique[key] = found
+        return found
+
+    def var(self, name: str) -> int:
+        """Retorna o nó de uma variável, adicionando-a ao fim da ordem caso seja nova."""
+        if name not in self.level:
+            # Folhas descem um nível para continuar abaixo de todas as variáveis
+            self.level[name] = len(self.order)
+            self.order.append(name)
+            self.levels[0] = self.levels[1] = len(self.order)
+        return self.node(self.level[name], self.FALSE, self.TRUE)
+
+    def cofactors(self, u: int, level: int) -> tuple[int, int]:
+        """Retorna os filhos de u em relação ao nível indicado."""
+        if self.levels[u] == level:
+            return self.lows[u], self.highs[u]
+        return u, u
+
+    def ite(self, f: int, g: int, h: int) -> int:
+        """If-Then-Else: (f ∧ g) ∨ (¬f ∧ h). Todas as operações binárias são escritas com ele."""
+        if f == self.TRUE:
+            return g
+        if f == self.FALSE:
+            return h
+        if g == h:
+            return g
+        if g == self.TRUE and h == self.FALSE:
+            return f
+
+        key: tuple[int, int, int] = (f, g, h)
+        found: Optional[int] = self.computed.get(key)
+        if found is not None:
+            return found
+
+        level: int = min(self.levels[f], self.levels[g], self.levels[h])
+        f0, f1 = self.cofactors(f, level)
+        g0, g1 = self.cofactors(g, level)
+        h0, h1 = self.cofactors(h, level)
+        found = self.node(level, self.ite(f0, g0, h0), self.ite(f1, g1, h1))
+        self.computed[key] = found
+        return found
+
+    def negate(self, f: int) -> int:
+        return self.ite(f, self.FALSE, self.TRUE)
+
+    def from_expression(self, expr: Expression) -> int:
+        """Converte uma expressão em um nó, percorrendo a árvore sem recursão."""
+        nodes: dict[int, int] = {}
+        for sub in postorder(expr):
+            if isinstance(sub, Operator):
+                build: Optional[Callable] = builders.get(type(sub))
+                # Operadores genéricos (sem tradução) valem Verdade, assim como em evaluate
+                nodes[id(sub)] = build(self, *(nodes[id(child)] for child in sub.children)) if build else self.TRUE
+            elif isinstance(sub, operands.VAR):
+                nodes[id(sub)] = self.var(sub.var)
+            elif isinstance(sub, operands.FALSE):
+                nodes[id(sub)] = self.FALSE
+            else:
+                nodes[id(sub)] = self.TRUE
+        return nodes[id(expr)]
+
+    def reachable(self, u: int) -> list[int]:
+        """Retorna os nós alcançáveis a partir de u em ordem crescente (filhos antes dos pais)."""
+        seen: set[int] = {u}
+        stack: list[int] = [u]
+        while stack:
+            v: int = stack.pop()
+            if v > self.TRUE:
+                for child in (self.lows[v], self.highs[v]):
+                    if child not in seen:
+                        seen.add(child)
+                        stack.append(child)
+        return sorted(seen)
+
+    def size(self, u: int) -> int:
+        """Quantidade de nós do BDD de u, incluindo as folhas."""
+        return len(self.reachable(u))
+
+    def count_models(self, u: int) -> int:
+        """Quantidade de atribuições de todas as variáveis da ordem que satisfazem u."""
+        counts: dict[int, int] = {self.FALSE: 0, self.TRUE: 1}
+        levels: list[int] = self.levels
+        for v in self.reachable(u):
+            if v > self.TRUE:
+                low, high = self.lows[v], self.highs[v]
+                # Variáveis puladas entre um nó e seu filho podem assumir qualquer valor
+                counts[v] = (counts[low] << (levels[low] - levels[v] - 1)) + (counts[high] << (levels[high] - levels[v] - 1))
+        return counts[u] << levels[u] if u > self.TRUE else counts[u] << len(self.order)
+
+    def satisfy_one(self, u: int) -> Optional[dict[str, bool]]:
+        """Retorna uma atribuição que satisfaz u, ou None caso não exista."""
+        if u == self.FALSE:
+            return None
+        assign: dict[str, bool] = {var: False for var in self.order}
+        while u > self.TRUE:
+            var: str = self.order[self.levels[u]]
+            if self.highs[u] != self.FALSE:
+                assign[var] = True
+                u = self.highs[u]
+            else:
+                u = self.lows[u]
+        return assign
+
+
+"""Tradução de cada operador para o ITE."""
+builders: dict[type, Callable] = {
+    NOT: lambda bdd, f: bdd.negate(f),
+    AND: lambda bdd, *fs: reduce(lambda f, g: bdd.ite(f, g, bdd.FALSE), fs),
+    OR: lambda bdd, *fs: reduce(lambda f, g: bdd.ite(f, bdd.TRUE, g), fs),
+    IMPLY: lambda bdd, f, g: bdd.ite(f, g, bdd.TRUE),
+    EQUAL: lambda bdd, f, g: bdd.ite(f, g, bdd.negate(g)),
+    XOR: lambda bdd, f, g: bdd.ite(f, bdd.negate(g), g),
+    NAND: lambda bdd, f, g: bdd.ite(f, bdd.negate(g), bdd.TRUE),
+    NOR: lambda bdd, f, g: bdd.ite(f, bdd.FALSE, bdd.negate(g)),
+}
+
+
+def order_variables(expr: Expression, variables: dict[str, bool] = None, method: str = "appearance") -> list[str]:
+    """
+    Escolhe a ordem das variáveis.
+    appearance: ordem em que aparecem no conjunto do parser (ou na expressão), que mantém próximas as variáveis relacionadas.
+    sorted: ordem alfabética, a mesma da tabela verdade.
+    """
+    if method not in ORDERS:
+        raise ValueError(f"Ordem desconhecida '{method}'. Opções: {ORDERS}")
+    names: list[str] = list(variables) if variables is not None else []
+    names.extend(var for var in expr.variables() if var not in names)
+    if method == "sorted":
+        names.sort()
+    return names
+
+
+def build(expr: Expression, variables: dict[str, bool] = None, method: str = "appearance") -> tuple[BDD, int]:
+    """Cria um gerenciador com a ordem escolhida e converte a expressão."""
+    bdd: BDD = BDD(order_variables(expr, variables, method))
+    return bdd, bdd.from_expression(expr)
+
+
+def is_tautology(expr: Expression, variables: dict[str, bool] = None) -> bool:
+    """Verifica se a expressão é sempre verdadeira."""
+    _, u = build(expr, variables)
+    return u == BDD.TRUE
+
+
+def is_satisfiable(expr: Expression, variables: dict[str, bool] = None) -> bool:
+    """Verifica se existe atribuição que torna a expressão verdadeira."""
+    _, u = build(expr, variables)
+    return u != BDD.FALSE
+
+
+def equivalent(left: Expression, right: Expression, variables: dict[str, bool] = None) -> bool:
+    """Verifica se as expressões possuem a mesma tabela verdade. Ambas usam o mesmo gerenciador."""
+    order: list[str] = order_variables(left, variables)
+    order.extend(var for var in right.variables() if var not in order)
+    bdd: BDD = BDD(order)
+    return bdd.from_expression(left) == bdd.from_expression(right)
+
+
+def count_models(expr: Expression, variables: dict[str, bool] = None) -> int:
+    """Quantidade de linhas verdadeiras da tabela verdade sobre as variáveis indicadas."""
+    bdd, u = build(expr, variables)
+    return bdd.count_models(u)
+
+
+def main() -> None:
+    from logic.calculator.parser import LogicParser
+
+    parser: LogicParser = LogicParser("(p → q) ⟷ (¬q → ¬p)", simplify_expression=False)
+    parser.parse()
+    print(f"Tautologia: {is_tautology(parser.expression, parser.variables)}")
+    print(f"Modelos: {count_models(parser.expression, parser.variables)}")
+
+
+if __name__ == '__main__':
+    main()
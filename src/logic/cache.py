@@ -0,0 +1,67 @@
+"""
+Cache limitado (LRU) compartilhado pelos módulos de cálculo.
+"""
+
+from collections import OrderedDict
+from threading import Lock
+
+
+class LRUCache:
+    """Guarda até maxsize resultados e descarta o usado há mais tempo. Conta acertos e falhas."""
+
+    def __init__(self, maxsize: int = 4096):
+        self.maxsize: int = maxsize
+        self.hits: int = 0
+        self.misses: int = 0
+        self.data: OrderedDict = OrderedDict()
+        self.lock: Lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(maxsize={self.maxsize}, size={len(self)}, hits={self.hits}, misses={self.misses})"
+
+    def get(self, key, default=None):
+        """Retorna o valor guardado e o marca como usado recentemente."""
+        with self.lock:
+            try:
+                value = self.data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self.data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value) -> None:
+        """Guarda um valor, descartando o mais antigo caso passe do tamanho máximo."""
+        with self.lock:
+            self.data[key] = value
+            self.data.move_to_end(key)
+            while len(self.data) > self.maxsize:
+                self.data.popitem(last=False)
+
+    def resize(self, maxsize: int) -> None:
+        """Altera o tamanho máximo."""
+        with self.lock:
+            self.maxsize = maxsize
+            while len(self.data) > self.maxsize:
+                self.data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Limpa os valores e os contadores."""
+        with self.lock:
+            self.data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Proporção de acertos entre todas as consultas."""
+        total: int = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> dict:
+        """Retorna os contadores do cache."""
+        return dict(hits=self.hits, misses=self.misses, hit_rate=self.hit_rate, size=len(self), maxsize=self.maxsize)
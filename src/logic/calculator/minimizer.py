@@ -0,0 +1,205 @@
+"""
+Minimização de dois níveis (soma de produtos) a partir dos mintermos de uma expressão.
+
+Um implicante é representado por (valor, máscara): os bits ligados na máscara são variáveis livres.
+O bit i de um mintermo corresponde à variável de índice (n - 1 - i) em ordem alfabética,
+a mesma ordem usada pelas linhas de TruthTable.
+"""
+
+from typing import Iterable, Optional
+
+from logic.calculator.table import gen_bit_variables
+from logic.model import Expression
+from logic.model.operands import TRUE, FALSE, VAR
+from logic.model.operators import AND, OR, NOT
+
+Cube = tuple[int, int]
+
+"""Até quantas variáveis é usado o método exato (Quine–McCluskey + Petrick)."""
+EXACT_LIMIT: int = 8
+
+"""Número máximo de produtos mantidos pelo método de Petrick antes de recorrer à cobertura gulosa."""
+PETRICK_LIMIT: int = 512
+
+
+def covers(cube: Cube, minterm: int) -> bool:
+    """Verifica se o implicante cobre o mintermo."""
+    value, mask = cube
+    return minterm & ~mask == value
+
+
+def literals(cube: Cube, length: int) -> int:
+    """Quantidade de literais do implicante."""
+    return length - bin(cube[1]).count("1")
+
+
+def prime_implicants(minterms: Iterable[int], length: int, dontcares: Iterable[int] = ()) -> list[Cube]:
+    """Combina implicantes que diferem em um único bit até não haver mais combinações (Quine–McCluskey)."""
+    current: set[Cube] = {(m, 0) for m in minterms}
+    current.update((m, 0) for m in dontcares)
+    primes: set[Cube] = set()
+
+    while current:
+        merged: set[Cube] = set()
+        used: set[Cube] = set()
+        for value, mask in current:
+            # Cada par é encontrado a partir do implicante com o bit desligado
+            for i in range(length):
+                bit: int = 1 << i
+                if not (value | mask) & bit and (value | bit, mask) in current:
+                    merged.add((value, mask | bit))
+                    used.add((value, mask))
+                    used.add((value | bit, mask))
+        primes.update(current - used)
+        current = merged
+    return sorted(primes)
+
+
+def greedy_cover(primes: list[Cube], minterms: Iterable[int], length: int) -> list[Cube]:
+    """Cobertura gulosa: escolhe o implicante que cobre mais mintermos restantes, com menos literais."""
+    remaining: set[int] = set(minterms)
+    chosen: list[Cube] = []
+    while remaining:
+        best: Cube = max(primes, key=lambda p: (sum(covers(p, m) for m in remaining), -literals(p, length)))
+        chosen.append(best)
+        remaining = {m for m in remaining if not covers(best, m)}
+    return chosen
+
+
+def petrick(primes: list[Cube], minterms: Iterable[int], length: int) -> Optional[list[Cube]]:
+    """
+    Método de Petrick: multiplica as somas de implicantes que cobrem cada mintermo e escolhe o menor produto.
+    Retorna None caso a quantidade de produtos passe de PETRICK_LIMIT.
+    """
+    products: set[frozenset] = {frozenset()}
+    for m in minterms:
+        covering: list[int] = [i for i, p in enumerate(primes) if covers(p, m)]
+        expanded: set[frozenset] = set()
+        for product in products:
+            if any(i in product for i in covering):
+                expanded.add(product)
+            else:
+                expanded.update(product | {i} for i in covering)
+
+        # Absorção: X + XY = X
+        products = set()
+        for product in sorted(expanded, key=len):
+            if not any(kept <= product for kept in products):
+                products.add(product)
+        if len(products) > PETRICK_LIMIT:
+            return None
+
+    best: frozenset = min(products, key=lambda s: (len(s), sum(literals(primes[i], length) for i in s), sorted(s)))
+    return [primes[i] for i in sorted(best)]
+
+
+def quine_mccluskey(minterms: Iterable[int], length: int, dontcares: Iterable[int] = ()) -> list[Cube]:
+    """Minimização exata: implicantes primos, essenciais e Petrick para os mintermos restantes."""
+    minterms = sorted(set(minterms))
+    primes: list[Cube] = prime_implicants(minterms, length, dontcares)
+
+    chosen: list[Cube] = []
+    remaining: list[int] = []
+    for m in minterms:
+        covering: list[Cube] = [p for p in primes if covers(p, m)]
+        if len(covering) == 1 and covering[0] not in chosen:
+            chosen.append(covering[0])
+    for m in minterms:
+        if not any(covers(p, m) for p in chosen):
+            remaining.append(m)
+
+    if remaining:
+        candidates: list[Cube] = [p for p in primes if p not in chosen and any(covers(p, m) for m in remaining)]
+        rest: Optional[list[Cube]] = petrick(candidates, remaining, length)
+        if rest is None:
+            rest = greedy_cover(candidates, remaining, length)
+        chosen.extend(rest)
+    return sorted(chosen)
+
+
+def espresso(on: int, dontcare: int, length: int) -> list[Cube]:
+    """
+    Heurística no estilo Espresso sobre conjuntos empacotados (bit i = mintermo i).
+    Expande cada mintermo ainda descoberto até um implicante primo e depois remove os implicantes redundantes.
+    """
+    full: int = (1 << (1 << length)) - 1
+    off: int = full & ~(on | dontcare)
+
+    # Expansão
+    cubes: list[Cube] = []
+    points: list[int] = []
+    covered: int = 0
+    uncovered: int = on
+    while uncovered:
+        seed: int = (uncovered & -uncovered).bit_length() - 1
+        value, mask = seed, 0
+        bits: int = 1 << seed
+        for i in range(length - 1, -1, -1):
+            shift: int = 1 << i
+            expanded: int = bits | (bits >> shift if value >> i & 1 else bits << shift)
+            if not expanded & off:
+                bits = expanded
+                value &= ~shift
+                mask |= shift
+        cubes.append((value, mask))
+        points.append(bits & on)
+        covered |= bits
+        uncovered = on & ~covered
+
+    # Irredundância: remove os implicantes cujos pontos já são cobertos pelos demais
+    suffix: list[int] = [0] * (len(points) + 1)
+    for i in range(len(points) - 1, -1, -1):
+        suffix[i] = suffix[i + 1] | points[i]
+    kept: list[Cube] = []
+    before: int = 0
+    for i in range(len(points)):
+        if points[i] & ~(before | suffix[i + 1]):
+            kept.append(cubes[i])
+            before |= points[i]
+    return sorted(kept)
+
+
+def minimize_minterms(minterms: Iterable[int], length: int, dontcares: Iterable[int] = (), *, exact: bool = None) -> list[Cube]:
+    """Escolhe o método: exato para poucas variáveis, heurístico para muitas."""
+    if exact is None:
+        exact = length <= EXACT_LIMIT
+    if exact:
+        return quine_mccluskey(minterms, length, dontcares)
+
+    on: int = 0
+    for m in minterms:
+        on |= 1 << m
+    dontcare: int = 0
+    for m in dontcares:
+        dontcare |= 1 << m
+    return espresso(on, dontcare, length)
+
+
+def to_expression(cubes: list[Cube], variables: list[str]) -> Expression:
+    """Constroi um OR n-ário de ANDs n-ários a partir dos implicantes."""
+    length: int = len(variables)
+    if not cubes:
+        return FALSE()
+
+    terms: list[Expression] = []
+    for value, mask in cubes:
+        literals: list[Expression] = []
+        for c, var in enumerate(variables):
+            bit: int = length - 1 - c
+            if not mask >> bit & 1:
+                literals.append(VAR(var) if value >> bit & 1 else NOT(VAR(var)))
+        if not literals:
+            return TRUE()
+        terms.append(literals[0] if len(literals) == 1 else AND(*literals))
+    return terms[0] if len(terms) == 1 else OR(*terms)
+
+
+def minimize(expression: Expression, variables: dict[str, bool] = None, *, exact: bool = None) -> Expression:
+    """Retorna a soma de produtos mínima (ou próxima da mínima) equivalente à expressão."""
+    if variables is None:
+        variables = expression.variables()
+    names: list[str] = sorted(variables)
+    bits, mask = gen_bit_variables(variables)
+    on: int = expression.evaluate_bits(bits, mask)
+    minterms: list[int] = [i for i in range(mask.bit_length()) if on >> i & 1]
+    return to_expression(minimize_minterms(minterms, len(names), exact=exact), names)
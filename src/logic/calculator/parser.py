@@ -1,6 +1,8 @@
 from enum import Enum, auto
 
-from logic.calculator.setup import setup, SetupResult
+from logic import dag
+from logic.cache import LRUCache
+from logic.calculator.setup import setup, get_vars, SetupResult
 from logic.calculator.table import TruthTable
 
 from logic.model import operators, operands, simplify
@@ -26,9 +28,40 @@ operator_map = {
     Logic.NAND: operators.NAND,
 }
 
+dag_map = {
+    Logic.AND: dag.OP_AND,
+    Logic.OR: dag.OP_OR,
+    Logic.EQUAL: dag.OP_EQUAL,
+    Logic.IMPLY: dag.OP_IMPLY,
+    Logic.XOR: dag.OP_XOR,
+    Logic.NOR: dag.OP_NOR,
+    Logic.NAND: dag.OP_NAND,
+}
+
 canon_permitted: list[Logic] = [Logic.OPEN, Logic.CLOSE, Logic.CONSTANT, Logic.VAR, Logic.AND, Logic.OR, Logic.NOT, Logic.EOF]
 
 
+class ParseResult:
+    """Resultado final de um parse guardado no cache. As expressões são imutáveis e podem ser compartilhadas."""
+
+    def __init__(self, expression: Expression, variables: dict[str, bool], canon: bool):
+        self.expression: Expression = expression
+        self.variables: dict[str, bool] = variables
+        self.canon: bool = canon
+
+
+"""Cache dos parses válidos, chaveado por (texto com espaços normalizados, normalize, simplify)."""
+parse_cache: LRUCache = LRUCache(maxsize=4096)
+
+
+def cache_key(expr: str, normalize: bool, simplify_expression: bool) -> tuple[str, bool, bool]:
+    """
+    Sequências de espaços em branco viram um único espaço; textos que só diferem nelas compartilham a entrada.
+    Os espaços não são removidos por completo porque separam identificadores ("a b" não é "ab").
+    """
+    return " ".join(expr.split()), normalize, simplify_expression
+
+
 def to_operand(token: Token) -> Operand:
     """Converte Token para Operand"""
     if token.kind == Logic.CONSTANT:
@@ -48,16 +81,40 @@ def to_operator(left: Operand, token: Token, right: Operand) -> Operator:
     raise BadToken(f"{token} não é um operador.")
 
 
+def to_dag_operand(graph: dag.ExpressionDAG, token: Token) -> int:
+    """Como to_operand, mas adiciona o nó ao DAG e retorna seu índice."""
+    if token.kind == Logic.CONSTANT:
+        if token.value in logic_map[Logic.TRUE]:
+            return graph.node(dag.OP_TRUE)
+        elif token.value in logic_map[Logic.FALSE]:
+            return graph.node(dag.OP_FALSE)
+    elif token.kind == Logic.VAR:
+        return graph.var(token.value)
+    raise BadToken(f"{token} não é um operando.")
+
+
+def to_dag_operator(graph: dag.ExpressionDAG, left: int, token: Token, right: int) -> int:
+    """Como to_operator, mas adiciona o nó ao DAG e retorna seu índice."""
+    if token.kind in dag_map:
+        return graph.node(dag_map[token.kind], left, right)
+    raise BadToken(f"{token} não é um operador.")
+
+
 class LogicParser:
     """
     Utilizado para ser intermediario entre as entradas do usuário e seus retornos.
     Essa classe transforma a entrada em Tokens e depois converte os Tokens em Operandos
+    Com as_dag, o parse emite direto um ExpressionDAG em self.dag, sem criar objetos de logic.model;
+    nesse caso normalize e o cache não se aplicam, e simplify_expression apenas cancela negações duplas.
     """
 
-    def __init__(self, expr: str = "", *, normalize: bool = False, simplify_expression: bool = True):
+    def __init__(self, expr: str = "", *, normalize: bool = False, simplify_expression: bool = True, use_cache: bool = True,
+                 as_dag: bool = False):
         # flags
         self.normalize: bool = normalize
         self.simplify: bool = simplify_expression
+        self.use_cache: bool = use_cache and not as_dag
+        self.as_dag: bool = as_dag
 
         # Usado para o parse
         self.tokens: list = []
@@ -68,7 +125,9 @@ class LogicParser:
         # Usado para calcular
         self.variables: dict[str, bool] = dict()
         self.expression: Expression = Expression()
+        self.dag: dag.ExpressionDAG = dag.ExpressionDAG()
         self.valid: bool = False
+        self.canon: bool = False
 
         self.expr: str = expr
 
@@ -89,23 +148,60 @@ class LogicParser:
         # calcular
         self.variables = dict()
         self.expression = Operand()
+        self.dag = dag.ExpressionDAG()
         self.valid = False
+        self.canon = False
 
     def parse(self) -> None:
-        """Função principal para conversão da entrada em Tokens e depois para Operandos"""
+        """
+        Função principal para conversão da entrada em Tokens e depois para Operandos.
+        Com use_cache, um texto já visto reaproveita o resultado final (sem tokens) do parse_cache.
+        """
         if self.state == ParseState.EOF:
             return
 
-        setup_result: SetupResult = setup(self.expr)
-        tokens: list[Token] = setup_result.tokens
-        # print(tokens)
-        variables: dict[str, bool] = setup_result.variables
+        key: tuple = cache_key(self.expr, self.normalize, self.simplify)
+        if self.use_cache:
+            cached: ParseResult = parse_cache.get(key)
+            if cached is not None:
+                self.state = ParseState.EOF
+                self.valid = True
+                self.expression = cached.expression
+                self.variables = dict(cached.variables)
+                self.canon = cached.canon
+                return
 
-        for t in tokens:
+        setup_result: SetupResult = setup(self.expr)
+        self.parse_tokens(setup_result.tokens, setup_result.variables)
+        if self.use_cache:
+            parse_cache.put(key, ParseResult(self.expression, dict(self.variables), self.canon))
+
+    def parse_tokens(self, tokens: list[Token], variables: dict[str, bool] = None, *, checkpoints: list = None,
+                     start: int = 0) -> None:
+        """
+        Parse de tokens já separados e terminados por EOF, como os de setup, sem passar pelo cache.
+        Usado quando os tokens vêm de outro lugar, como a retokenização incremental do REPL.
+        Com checkpoints, guarda nela o estado (state, operadores, operandos) antes de cada token.
+        start recomeça do estado guardado antes de tokens[start], quando os tokens anteriores são os mesmos do parse que o guardou.
+        """
+        if variables is None:
+            variables = get_vars(tokens)
+        if checkpoints is not None:
+            del checkpoints[start + 1:]
+            if start:
+                state, saved_operators, saved_operands = checkpoints[start]
+                self.state, self.operators, self.operands = state, list(saved_operators), list(saved_operands)
+            else:
+                checkpoints.clear()
+
+        for i in range(start, len(tokens)):
+            t: Token = tokens[i]
+            if checkpoints is not None and i == len(checkpoints):
+                checkpoints.append((self.state, tuple(self.operators), tuple(self.operands)))
             # Espera um operando para juntar com um operador.
             if self.state == ParseState.OPERAND:
                 if t.kind in (Logic.CONSTANT, Logic.VAR):
-                    self.append(to_operand(t))
+                    self.append(self.to_operand(t))
                     self.state = ParseState.OPERATOR
                 elif t.kind in (Logic.OPEN, Logic.NOT):
                     self.operators.append(t)
@@ -138,7 +234,7 @@ class LogicParser:
                         op: Token = self.operators.pop()
                         right: Operand = self.operands.pop()
                         left: Operand = self.operands.pop()
-                        self.append(to_operator(left, op, right))
+                        self.append(self.to_operator(left, op, right))
 
                         if self.operators and self.last().kind == Logic.IMPLY and op.priority > self.last().priority:
                             self.stack_all()
@@ -163,7 +259,7 @@ class LogicParser:
                         curr_right: Operand = self.operands.pop()
                         curr_left: Operand = self.operands.pop()
 
-                        self.append(to_operator(curr_left, curr, curr_right))
+                        self.append(self.to_operator(curr_left, curr, curr_right))
 
                     ex: Operand = self.operands.pop()
                     self.append(ex)
@@ -182,9 +278,13 @@ class LogicParser:
         self.state = ParseState.EOF
         self.valid = True
         self.tokens = tokens
-        self.expression = self.operands.pop()
         self.variables = variables
+        self.canon = all(t.kind in canon_permitted for t in tokens)
+        if self.as_dag:
+            self.dag.root = self.operands.pop()
+            return
 
+        self.expression = self.operands.pop()
         self.apply_options()
 
     def apply_options(self):
@@ -196,6 +296,24 @@ class LogicParser:
             self.expression = simplify(self.expression)
             self.variables = self.expression.variables()
 
+    def to_operand(self, token: Token):
+        """Converte o Token em operando: um Operand ou, com as_dag, o índice do nó no DAG."""
+        if self.as_dag:
+            return to_dag_operand(self.dag, token)
+        return to_operand(token)
+
+    def to_operator(self, left, token: Token, right):
+        """Constroi o operador: um Operator ou, com as_dag, o índice do nó no DAG."""
+        if self.as_dag:
+            return to_dag_operator(self.dag, left, token, right)
+        return to_operator(left, token, right)
+
+    def negate(self, expr):
+        """Nega o operando: um NOT ou, com as_dag, o índice do nó no DAG."""
+        if self.as_dag:
+            return self.dag.node(dag.OP_NOT, expr)
+        return operators.NOT(expr)
+
     def last(self) -> Token:
         """Retorna o último operador Token sem removê-lo."""
         assert self.operators
@@ -207,7 +325,7 @@ class LogicParser:
             op: Token = self.operators.pop()
             right: Operand = self.operands.pop()
             left: Operand = self.operands.pop()
-            self.append(to_operator(left, op, right))
+            self.append(self.to_operator(left, op, right))
 
     def is_valid(self) -> bool:
         """Indica se não houve problemas durante o parse."""
@@ -215,10 +333,7 @@ class LogicParser:
 
     def is_canon(self) -> bool:
         """Verifica se os tokens constroem uma Fórmula canônica."""
-        for i in self.tokens:
-            if i.kind not in canon_permitted:
-                return False
-        return True
+        return self.canon
 
     def get_table(self) -> TruthTable:
         """Prepara uma tabela com o operando e suas variaveis"""
@@ -233,10 +348,10 @@ class LogicParser:
                 negates += 1
 
             if negates & 1:
-                expr = operators.NOT(expr)
+                expr = self.negate(expr)
         else:
             while self.operators and self.last().kind == Logic.NOT:
                 self.operators.pop()
-                expr = operators.NOT(expr)
+                expr = self.negate(expr)
 
         self.operands.append(expr)
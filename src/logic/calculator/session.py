@@ -0,0 +1,118 @@
+"""
+Estado do REPL entre uma linha e outra: texto, tokens, expressão e coluna da tabela verdade.
+Cada linha nova retokeniza só o trecho editado, continua o parse do primeiro token diferente
+e recalcula só as subárvores novas; as colunas das demais vêm do cache.
+"""
+
+from __future__ import annotations
+
+import bisect
+from typing import Optional
+
+from logic.cache import LRUCache
+from logic.calculator.parser import LogicParser
+from logic.calculator.table import TruthTable, gen_bit_variables, insert_variable, remove_variable
+from logic.model import Expression, Operator, memoized_fold
+from logic.stream.core import Token, rescan
+
+"""Colunas guardadas por subárvore. Com 16 variáveis cada uma ocupa 8 KB."""
+COLUMN_CACHE_SIZE: int = 512
+
+
+class Session:
+    """
+    Mantém o parser e a coluna resultado empacotada (como gen_bit_variables) da última fórmula válida.
+    Se a linha nova só acrescenta '∧ r', a expressão anterior é a mesma subárvore (os nós são únicos),
+    então a coluna nova é uma única operação bit a bit com a coluna guardada.
+    """
+
+    def __init__(self, *, normalize: bool = False, simplify_expression: bool = False):
+        self.parser: LogicParser = LogicParser(normalize=normalize, simplify_expression=simplify_expression, use_cache=False)
+
+        # Última linha tokenizada, a posição final de cada token e o estado do parser antes de cada um
+        self.text: str = ""
+        self.tokens: list[Token] = []
+        self.ends: list[int] = []
+        self.checkpoints: list[tuple] = []
+
+        # Variáveis das colunas, em ordem alfabética, e seus valores empacotados
+        self.names: list[str] = []
+        self.bits: dict[str, int] = {}
+        self.mask: int = 1
+        self.columns: LRUCache = LRUCache(COLUMN_CACHE_SIZE)
+        self.column: Optional[int] = None
+
+    def update(self, text: str) -> LogicParser:
+        """
+        Faz o parse da linha e calcula sua coluna. BadToken e ParseError são repassados;
+        o parser fica inválido, mas os tokens e colunas guardados continuam servindo para a próxima linha.
+        """
+        self.parser.expr = text
+        self.column = None
+        tokens, self.ends = rescan(self.text, self.tokens, self.ends, text)
+        self.text = text
+
+        # O parse recomeça no primeiro token diferente da linha anterior
+        start: int = 0
+        limit: int = min(len(tokens), len(self.tokens), len(self.checkpoints) - 1)
+        while start < limit and tokens[start].kind == self.tokens[start].kind and tokens[start].value == self.tokens[start].value:
+            start += 1
+        self.tokens = tokens
+        self.parser.parse_tokens(tokens + [Token()], checkpoints=self.checkpoints, start=start)
+        self.evaluate()
+        return self.parser
+
+    def evaluate(self) -> int:
+        """Coluna resultado da expressão atual; subárvores com coluna guardada não são percorridas."""
+        names: list[str] = sorted(self.parser.variables)
+        if names != self.names:
+            self.relayout(names)
+        self.column = memoized_fold(self.parser.expression, self.columns, {}, self.step)
+        return self.column
+
+    def step(self, node: Expression, *values: int) -> int:
+        if isinstance(node, Operator):
+            return node.bitwise(self.mask, *values)
+        return node.evaluate_bits(self.bits, self.mask)
+
+    def relayout(self, names: list[str]) -> None:
+        """
+        Troca as variáveis das colunas. Só as maiores subárvores guardadas que continuam na expressão são adaptadas,
+        com insert_variable e remove_variable; o resto do cache é descartado.
+        """
+        old: LRUCache = self.columns
+        self.columns = LRUCache(COLUMN_CACHE_SIZE)
+        present: set[str] = set(names)
+        removed: list[str] = [name for name in self.names if name not in present]
+        added: list[str] = [name for name in names if name not in self.names]
+
+        seen: set[int] = set()
+        stack: list[Expression] = [self.parser.expression]
+        while stack:
+            node: Expression = stack.pop()
+            if id(node) in seen:
+                continue
+            seen.add(id(node))
+            entry: Optional[tuple[Expression, int]] = old.get(id(node))
+            if entry is None:
+                stack.extend(node.children)
+                continue
+
+            bits: int = entry[1]
+            layout: list[str] = list(self.names)
+            for name in removed:
+                position: int = layout.index(name)
+                bits = remove_variable(bits, len(layout), position)
+                layout.pop(position)
+            for name in added:
+                position = bisect.bisect_left(layout, name)
+                bits = insert_variable(bits, len(layout), position)
+                layout.insert(position, name)
+            self.columns.put(id(node), (node, bits))
+
+        self.names = names
+        self.bits, self.mask = gen_bit_variables(dict.fromkeys(names, True))
+
+    def table(self) -> TruthTable:
+        """Tabela da última fórmula válida, usando a coluna já calculada."""
+        return TruthTable(self.parser.expression, self.parser.variables, bits=self.column)
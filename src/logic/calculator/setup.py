@@ -4,10 +4,6 @@ Essa seção prepara os tokens e as variáveis de uma expressão.
 
 from logic.stream.core import ReturnString, InputStream, TokenStream, Logic, Token
 
-text_stream = ReturnString()
-cin = InputStream(text_stream)
-ts = TokenStream(cin)
-
 class SetupResult:
     def __init__(self, tokens: list[Token], variables: dict[str, bool]):
         self.tokens: list[Token] = tokens
@@ -21,10 +17,13 @@ def setup(expr: str) -> SetupResult:
 
 
 def tokenize(expr: str) -> list[Token]:
-    """Define a expressão na stream. A resgata com input e depois a tokeniza."""
-    text_stream.text = expr
+    """
+    Define a expressão na stream. A resgata com input e depois a tokeniza.
+    Cada chamada cria suas próprias streams; chamadas concorrentes não compartilham buffers.
+    """
+    cin = InputStream(ReturnString(expr))
     cin.input()
-    return ts.tokenize()
+    return TokenStream(cin).tokenize()
 
 
 def get_vars(tokens: list[Token]) -> dict[str, bool]:
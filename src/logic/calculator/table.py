@@ -1,24 +1,122 @@
-import tabulate
+import csv
+import itertools
+import sys
+from typing import Iterator, TextIO
 
+try:
+    import numpy as np
+except ImportError:  # NumPy é opcional: sem ele, TruthTable.matrix retorna listas
+    np = None
+
+try:
+    import tabulate
+except ImportError:  # tabulate é opcional: show usa o desenho próprio de write_grid
+    tabulate = None
+
+try:
+    import wcwidth
+except ImportError:  # Sem wcwidth, todo caractere ocupa uma coluna (como no tabulate)
+    wcwidth = None
+
+from logic.cache import LRUCache
 from logic.model import Expression
+from logic.symbols import SymbolTable
+
+"""Quantidade de variáveis avaliadas juntas em cada bloco de iter_rows (2^CHUNK_BITS linhas por bloco)."""
+CHUNK_BITS: int = 12
 
 
 def gen_variables(expr_vars: dict[str, bool]) -> list[dict]:
     """Gera árvore verdade a partir de variaveis"""
-    vars_table: list[dict] = []
+    return list(iter_variables(expr_vars))
+
+
+def iter_variables(expr_vars: dict[str, bool]) -> Iterator[dict]:
+    """Mesmas atribuições de gen_variables, geradas uma a uma."""
     if not expr_vars:
-        return vars_table
+        return
+    variables: list = sorted(expr_vars.keys())
+    for values in itertools.product((True, False), repeat=len(variables)):
+        yield dict(zip(variables, values))
+
+
+def gen_bit_variables(expr_vars: dict[str, bool]) -> tuple[dict[str, int], int]:
+    """
+    Empacota todas as atribuições de cada variável em um único inteiro.
+    O bit i representa a linha com atribuição i (mesma ordem de gen_variables). Retorna o mapa e a máscara das linhas.
+    """
     variables: list = sorted(expr_vars.keys())
     length: int = len(variables)
-    size: int = 2 ** length - 1
+    rows: int = 2 ** length
+    mask: int = (1 << rows) - 1
+
+    bits: dict[str, int] = {}
+    for c, var in enumerate(variables):
+        width: int = 1 << (length - 1 - c)  # Tamanho de cada bloco de zeros/uns
+        bits[var] = block_mask(width, rows) << width
+    return bits, mask
+
+
+"""Máscaras de block_mask já calculadas, por (width, total); repetem-se entre tabelas com a mesma quantidade de variáveis."""
+mask_cache: LRUCache = LRUCache(maxsize=64)
+
 
-    for i in range(size, -1, -1):
-        row: dict = {}
-        b: str = format(i, f'#0{length + 2}b')[2:]  # Remove '0b'
-        for c in range(0, len(b)):
-            row[variables[c]] = (bool(int(b[c])))
-        vars_table.append(row)
-    return vars_table
+def block_mask(width: int, total: int) -> int:
+    """Blocos alternados de width bits ligados e width desligados, começando pelos ligados, em total bits."""
+    found: int = mask_cache.get((width, total))
+    if found is not None:
+        return found
+    pattern: int = (1 << width) - 1
+    period: int = width << 1
+    # Dobra o padrão até preencher todas as linhas
+    while period < total:
+        pattern |= pattern << period
+        period <<= 1
+    mask_cache.put((width, total), pattern)
+    return pattern
+
+
+def insert_variable(bits: int, length: int, position: int) -> int:
+    """
+    Adapta uma coluna empacotada de length variáveis para uma nova variável na coluna position (ordem alfabética).
+    O resultado não depende da nova variável: cada bloco de linhas abaixo dela é separado e duplicado, em O(length) operações.
+    """
+    width: int = 1 << (length - position)
+    total: int = 2 << length
+    # Espalha: o bloco t de width bits vai para a posição 2 * t * width, do maior deslocamento para o menor
+    for m in reversed(range(position)):
+        shift: int = width << m
+        bits = (bits | bits << shift) & block_mask(shift, total)
+    return bits | bits << width
+
+
+def remove_variable(bits: int, length: int, position: int) -> int:
+    """
+    Inverso de insert_variable: mantém as linhas em que a variável da coluna position é falsa e as junta.
+    Só faz sentido se o resultado não depende dessa variável.
+    """
+    width: int = 1 << (length - 1 - position)
+    total: int = 1 << length
+    bits &= block_mask(width, total)
+    for m in range(position):
+        shift: int = width << m
+        bits = (bits | bits >> shift) & block_mask(shift << 1, total)
+    return bits
+
+
+def gen_matrix(length: int):
+    """
+    Matriz 2^length × length com todas as atribuições, na mesma ordem de gen_variables (requer NumPy).
+    A linha k é a atribuição i = 2^length - 1 - k; a coluna c é o bit length - 1 - c de i.
+    """
+    rows = np.arange(2 ** length - 1, -1, -1)
+    shifts = np.arange(length - 1, -1, -1)
+    return ((rows[:, None] >> shifts) & 1).astype(bool)
+
+
+def bits_to_str(bits: int, rows: int) -> str:
+    """Converte um inteiro empacotado em uma string 'V'/'F' por linha, da maior atribuição para a menor."""
+    return format(bits, f'0{rows}b').translate(bits_table)
 
 
 def bool_to_str(boolean: bool) -> str:
@@ -28,36 +126,238 @@ def bool_to_str(boolean: bool) -> str:
     return "F"
 
 
+bits_table: dict = str.maketrans('01', 'FV')
+
+"""Bordas do formato fancy_grid do tabulate: (início, preenchimento, junção, fim) de cada linha divisória."""
+grid_borders: dict[str, tuple[str, str, str, str]] = {
+    "top": ("╒", "═", "╤", "╕"),
+    "header": ("╞", "═", "╪", "╡"),
+    "row": ("├", "─", "┼", "┤"),
+    "bottom": ("╘", "═", "╧", "╛"),
+}
+
+
+def text_width(text: str) -> int:
+    """Colunas ocupadas no terminal; com wcwidth, caracteres largos (como CJK) ocupam duas, igual ao tabulate."""
+    if wcwidth is None:
+        return len(text)
+    return wcwidth.wcswidth(text)
+
+
+def center(text: str, width: int) -> str:
+    """Centraliza o texto em width colunas; a sobra ímpar fica à direita, como no tabulate."""
+    return format(text, f"^{width + len(text) - text_width(text)}")
+
+
+def grid_line(widths: list[int], kind: str) -> str:
+    """Linha divisória do fancy_grid para colunas com as larguras indicadas (sem o espaço de cada lado)."""
+    begin, fill, join, end = grid_borders[kind]
+    return begin + join.join(fill * (width + 2) for width in widths) + end + "\n"
+
+
 class TruthTable:
-    def __init__(self, operand: Expression, variables: dict[str, bool] = None):
+    def __init__(self, operand: Expression, variables: dict[str, bool] = None, *, bitwise: bool = True, bits: int = None):
+        """bits: coluna resultado já calculada e empacotada (como gen_bit_variables), usada no lugar de avaliar a expressão."""
         self.expression: Expression = operand
         if variables is None:
             variables = self.expression.variables()
         self.variables: dict[str, bool] = variables
+        # Colunas em ordem alfabética; cada variável é indexada pelo seu id
+        self.symbols: SymbolTable = SymbolTable.sorted(variables)
+        self.bitwise: bool = bitwise
+        self.bits: int = bits
 
     def header(self) -> list[str]:
         """Constroi o cabeçalho da tabela."""
-        header: list[str] = [k for k in sorted(self.variables)]
+        header: list[str] = list(self.symbols)
         header.append(self.expression.stringify(dict()))
         return header
 
+    def column(self) -> str:
+        """Calcula a coluna resultado com uma única passada bit a bit pela expressão."""
+        if self.bits is not None:
+            return bits_to_str(self.bits, 2 ** len(self.variables))
+        bits, mask = gen_bit_variables(self.variables)
+        return bits_to_str(self.expression.evaluate_bits(bits, mask), 2 ** len(self.variables))
+
+    def matrix(self):
+        """
+        Tabela inteira como matriz booleana 2^n × (n + 1): as colunas das variáveis (ordem alfabética) e o resultado.
+        Com NumPy é um ndarray calculado coluna a coluna: a avaliação bit a bit recebe vetores de 0/1 no lugar dos inteiros.
+        Sem NumPy, retorna as mesmas linhas como listas de bool.
+        """
+        length: int = len(self.symbols)
+        if np is None:
+            bits, mask = gen_bit_variables(self.variables)
+            column: str = bits_to_str(self.expression.evaluate_bits(bits, mask), 2 ** length)
+            return [[*values, cell == "V"]
+                    for values, cell in zip(itertools.product((True, False), repeat=length), column)]
+
+        table = np.empty((2 ** length, length + 1), dtype=bool)
+        table[:, :length] = gen_matrix(length)
+        # uint8 em vez de bool: as operações com os inteiros 0 e a máscara 1 mantêm o tipo do vetor
+        columns: dict = {var: table[:, c].view(np.uint8) for c, var in enumerate(self.symbols)}
+        # Constantes e variáveis não atribuídas voltam como escalares; o resultado é expandido para a coluna inteira
+        table[:, length] = self.expression.evaluate_bits(columns, np.uint8(1))
+        return table
+
     def generate(self) -> tuple[list, list]:
         """Gera a tabela verdade a partir de seu operando e variáveis."""
-        truth: list[dict] = gen_variables(self.variables)
-        header = self.header()
-        table: list[list] = []
+        return self.header(), list(self.iter_rows())
+
+    def iter_rows(self) -> Iterator[list[str]]:
+        """Gera as linhas da tabela uma a uma, da maior atribuição para a menor, sem guardar a tabela."""
+        if self.bitwise:
+            yield from self.iter_bits()
+            return
+
+        if not self.symbols:
+            yield [bool_to_str(self.expression.evaluate(dict()))]
+            return
+
+        # A função recebe as variáveis pela posição (o id), então cada linha é só uma tupla de valores
+        function = self.expression.compile(self.variables)
+        for values in itertools.product((True, False), repeat=len(self.symbols)):
+            row: list[str] = [bool_to_str(value) for value in values]
+            row.append(bool_to_str(function(*values)))
+            yield row
+
+    def iter_bits(self) -> Iterator[list[str]]:
+        """Linhas calculadas bit a bit, um bloco de iter_blocks por vez."""
+        if not self.variables:
+            yield [bool_to_str(self.expression.evaluate(dict()))]
+            return
+
+        low_cells: list[str] = self.block_cells()
+        for head, column in self.iter_blocks():
+            for row, low in enumerate(low_cells):
+                cells: list[str] = list(head)
+                cells.extend(low)
+                cells.append(column[row])
+                yield cells
+
+    def iter_lines(self, delimiter: str = ',') -> Iterator[str]:
+        """Mesmas linhas de iter_rows já unidas pelo separador. Células 'V'/'F' dispensam aspas."""
+        if not self.bitwise or not self.variables:
+            for row in self.iter_rows():
+                yield delimiter.join(row) + '\n'
+            return
+
+        low_cells: list[str] = [delimiter.join(low) + delimiter for low in self.block_cells()]
+        for head, column in self.iter_blocks():
+            head = delimiter.join(head) + delimiter if head else ""
+            for row, low in enumerate(low_cells):
+                yield head + low + column[row] + '\n'
+
+    def block_cells(self) -> list[str]:
+        """Valores das últimas CHUNK_BITS variáveis em cada linha de um bloco, iguais em todos os blocos."""
+        low: int = min(len(self.variables), CHUNK_BITS)
+        return [bits_to_str(i, low) for i in range(2 ** low - 1, -1, -1)]
+
+    def iter_blocks(self) -> Iterator[tuple[str, str]]:
+        """
+        Avalia a expressão bit a bit em blocos de 2^CHUNK_BITS linhas.
+        Em cada bloco as primeiras variáveis são constantes (máscara cheia ou zero) e as últimas CHUNK_BITS variam.
+        Gera (valores das variáveis constantes, coluna resultado do bloco).
+        """
+        variables: list[str] = self.symbols.names
+        length: int = len(variables)
+        low: int = min(length, CHUNK_BITS)
+        high: int = length - low
+        low_bits, mask = gen_bit_variables(dict.fromkeys(variables[high:], True))
+
+        for prefix in range(2 ** high - 1, -1, -1):
+            if self.bits is not None:
+                # O bloco são as linhas prefix * 2^low até (prefix + 1) * 2^low - 1 da coluna já calculada
+                yield bits_to_str(prefix, high) if high else "", bits_to_str(self.bits >> (prefix << low) & mask, 2 ** low)
+                continue
+            assign: dict[str, int] = dict(low_bits)
+            for c, var in enumerate(variables[:high]):
+                assign[var] = mask if prefix >> (high - 1 - c) & 1 else 0
+            column: str = bits_to_str(self.expression.evaluate_bits(assign, mask), 2 ** low)
+            yield bits_to_str(prefix, high) if high else "", column
+
+    def write_csv(self, file: TextIO = None, *, chunk_size: int = 2 ** CHUNK_BITS, delimiter: str = ',') -> int:
+        """Escreve a tabela em CSV, de chunk_size em chunk_size linhas. Retorna a quantidade de linhas escritas."""
+        if file is None:
+            file = sys.stdout
+        csv.writer(file, delimiter=delimiter, lineterminator='\n').writerow(self.header())
+
+        count: int = 0
+        lines: Iterator[str] = self.iter_lines(delimiter)
+        while chunk := list(itertools.islice(lines, chunk_size)):
+            file.write("".join(chunk))
+            count += len(chunk)
+        return count
+
+    def grid_widths(self) -> list[int]:
+        """
+        Largura de cada coluna no fancy_grid: o cabeçalho mais 2, o mínimo do tabulate.
+        As células têm um caractere ('V'/'F'), então nunca alargam a coluna e a tabela não precisa ser percorrida antes.
+        """
+        return [text_width(name) + 2 for name in self.header()]
+
+    def iter_grid(self, widths: list[int]) -> Iterator[str]:
+        """Linhas de dados do fancy_grid, sem as divisórias. Cada célula é uma de duas strings montadas uma vez por coluna."""
+        cells: list[dict[str, str]] = [{value: f"│ {center(value, width)} " for value in "VF"} for width in widths]
+        if not self.bitwise or not self.variables:
+            for row in self.iter_rows():
+                yield "".join(cells[c][value] for c, value in enumerate(row)) + "│\n"
+            return
+
+        high: int = len(self.symbols) - min(len(self.symbols), CHUNK_BITS)
+        low_cells: list[str] = ["".join(cells[high + c][value] for c, value in enumerate(low)) for low in self.block_cells()]
+        result: dict[str, str] = {value: cell + "│\n" for value, cell in cells[-1].items()}
+        for head, column in self.iter_blocks():
+            head = "".join(cells[c][value] for c, value in enumerate(head))
+            for row, low in enumerate(low_cells):
+                yield head + low + result[column[row]]
+
+    def write_grid(self, file: TextIO = None, *, chunk_size: int = 2 ** CHUNK_BITS) -> int:
+        """
+        Escreve a tabela no formato fancy_grid do tabulate, de chunk_size em chunk_size linhas, sem guardar a tabela.
+        Retorna a quantidade de linhas escritas.
+        """
+        if file is None:
+            file = sys.stdout
+        widths: list[int] = self.grid_widths()
+        file.write(grid_line(widths, "top"))
+        file.write("│" + "│".join(f" {center(name, width)} " for name, width in zip(self.header(), widths)) + "│\n")
+        file.write(grid_line(widths, "header"))
+
+        divider: str = grid_line(widths, "row")
+        count: int = 0
+        lines: Iterator[str] = self.iter_grid(widths)
+        while chunk := list(itertools.islice(lines, chunk_size)):
+            if count:
+                file.write(divider)
+            file.write(divider.join(chunk))
+            count += len(chunk)
+        file.write(grid_line(widths, "bottom"))
+        return count
+
+    def show(self, file: TextIO = None, *, use_tabulate: bool = False) -> None:
+        """
+        Mostra a tabela com write_grid. Com use_tabulate e o tabulate instalado, monta a tabela inteira e usa o tabulate,
+        com o mesmo resultado, mas lento e com toda a tabela em memória para 2^16 linhas ou mais.
+        """
+        if file is None:
+            file = sys.stdout
+        if use_tabulate and tabulate is not None:
+            header, data = self.generate()
+            print(tabulate.tabulate(data, headers=header, tablefmt='fancy_grid', stralign='center'), file=file)
+            return
+        self.write_grid(file)
+
 
-        for var_dict in truth:
-            row: list[str] = [bool_to_str(var_dict[key]) for key in sorted(var_dict)]
-            row.append(bool_to_str(self.expression.evaluate(var_dict)))
-            table.append(row)
+def main() -> None:
+    """Uso (a partir de src): python -m logic.calculator.table "fórmula" > tabela.csv"""
+    from logic.calculator.parser import LogicParser
 
-        if not truth:
-            table.append([bool_to_str(self.expression.evaluate(dict()))])
+    parser: LogicParser = LogicParser(" ".join(sys.argv[1:]) or "(p ∧ q) → r")
+    parser.parse()
+    parser.get_table().write_csv(sys.stdout)
 
-        return header, table
 
-    def show(self) -> None:
-        """Prepara os dados e usa o módulo tabulate para mostrar a tabela."""
-        header, data = self.generate()
-        print(tabulate.tabulate(data, headers=header, tablefmt='fancy_grid', stralign='center'))
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,151 @@
+"""
+Representação compacta de uma expressão como DAG em vetores paralelos.
+Cada nó é um índice: ops guarda o código da operação e args os índices dos filhos, em ordem topológica
+(filhos antes dos pais). Fórmulas grandes são avaliadas percorrendo os vetores, sem seguir ponteiros entre objetos.
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import Optional
+
+from logic.model import Expression, postorder, operands
+from logic.symbols import SymbolTable
+from logic.model.operators import NOT, AND, OR, IMPLY, EQUAL, XOR, NAND, NOR
+
+"""Códigos das operações."""
+OP_FALSE: int = 0
+OP_TRUE: int = 1
+OP_VAR: int = 2
+OP_NOT: int = 3
+OP_AND: int = 4
+OP_OR: int = 5
+OP_IMPLY: int = 6
+OP_EQUAL: int = 7
+OP_XOR: int = 8
+OP_NAND: int = 9
+OP_NOR: int = 10
+
+"""Classe do modelo de cada código e o inverso."""
+kinds: tuple = (operands.FALSE, operands.TRUE, operands.VAR, NOT, AND, OR, IMPLY, EQUAL, XOR, NAND, NOR)
+opcodes: dict[type, int] = {kind: code for code, kind in enumerate(kinds)}
+
+
+class ExpressionDAG:
+    """
+    Nós em vetores paralelos: ops[i] é o código do nó i e args[offsets[i]:offsets[i + 1]] seus filhos.
+    Em VAR, o único argumento é o id da variável em symbols. Nós iguais são únicos; root é o nó da expressão inteira.
+    """
+
+    def __init__(self):
+        self.ops: array = array('B')
+        self.offsets: array = array('i', [0])
+        self.args: array = array('i')
+        self.symbols: SymbolTable = SymbolTable()
+        self.root: int = -1
+
+        self.unique: dict[tuple, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.ops)
+
+    def node(self, op: int, *args: int) -> int:
+        """Retorna o nó (op, args), reaproveitando um igual."""
+        key: tuple = (op, *args)
+        found: Optional[int] = self.unique.get(key)
+        if found is None:
+            found = len(self.ops)
+            self.ops.append(op)
+            self.args.extend(args)
+            self.offsets.append(len(self.args))
+            self.unique[key] = found
+        return found
+
+    def var(self, name: str) -> int:
+        """Retorna o nó de uma variável."""
+        return self.node(OP_VAR, self.symbols.add(name))
+
+    def children(self, i: int) -> array:
+        """Retorna os filhos do nó i."""
+        return self.args[self.offsets[i]:self.offsets[i + 1]]
+
+    def variables(self) -> dict[str, bool]:
+        """Variáveis na ordem em que aparecem."""
+        return dict.fromkeys(self.symbols, True)
+
+    @classmethod
+    def from_expression(cls, expr: Expression) -> ExpressionDAG:
+        """Converte uma árvore de logic.model. Subárvores compartilhadas viram um único nó."""
+        dag: ExpressionDAG = cls()
+        index: dict[int, int] = {}
+        for node in postorder(expr):
+            if node.type == operands.VAR:
+                index[id(node)] = dag.var(node.var)
+            else:
+                index[id(node)] = dag.node(opcodes[node.type], *(index[id(child)] for child in node.children))
+        dag.root = index[id(expr)]
+        return dag
+
+    def to_expression(self) -> Expression:
+        """Converte de volta para uma árvore de logic.model."""
+        ops, offsets, args, names = self.ops, self.offsets, self.args, self.symbols.names
+        nodes: list[Expression] = []
+        for i, op in enumerate(ops):
+            if op == OP_VAR:
+                nodes.append(operands.VAR(names[args[offsets[i]]]))
+            else:
+                nodes.append(kinds[op](*(nodes[j] for j in args[offsets[i]:offsets[i + 1]])))
+        return nodes[self.root]
+
+    def evaluate_bits(self, assign: dict[str, int], mask: int) -> int:
+        """
+        Calcula todas as linhas de uma vez percorrendo os vetores, como Expression.evaluate_bits.
+        Variáveis não atribuídas valem Verdade em todas as linhas.
+        """
+        return self.evaluate_ids(self.symbols.pack(assign, mask), mask)
+
+    def evaluate_ids(self, inputs: list[int], mask: int) -> int:
+        """Como evaluate_bits, mas os bits de cada variável vêm em uma lista indexada pelo id em symbols."""
+        ops, offsets, args = self.ops, self.offsets, self.args
+        values: list[int] = []
+        append = values.append
+        for i, op in enumerate(ops):
+            start: int = offsets[i]
+            if op == OP_VAR:
+                append(inputs[args[start]])
+            elif op == OP_NOT:
+                append(mask ^ values[args[start]])
+            elif op == OP_AND:
+                result: int = mask
+                for j in range(start, offsets[i + 1]):
+                    result &= values[args[j]]
+                append(result)
+            elif op == OP_OR:
+                result: int = 0
+                for j in range(start, offsets[i + 1]):
+                    result |= values[args[j]]
+                append(result)
+            elif op == OP_TRUE:
+                append(mask)
+            elif op == OP_FALSE:
+                append(0)
+            else:
+                left: int = values[args[start]]
+                right: int = values[args[start + 1]]
+                if op == OP_IMPLY:
+                    append((mask ^ left) | right)
+                elif op == OP_EQUAL:
+                    append(mask ^ (left ^ right))
+                elif op == OP_XOR:
+                    append(left ^ right)
+                elif op == OP_NAND:
+                    append(mask ^ (left & right))
+                else:
+                    append(mask ^ (left | right))
+        return values[self.root]
+
+    def evaluate(self, assign: dict[str, bool] = None) -> bool:
+        """Calcula uma linha: é a avaliação em bits com uma única linha."""
+        if assign is None:
+            assign = {}
+        return bool(self.evaluate_bits({name: int(value) for name, value in assign.items()}, 1))
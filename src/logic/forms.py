@@ -0,0 +1,241 @@
+"""
+Formas normais: negação só nos literais (NNF), forma normal conjuntiva (CNF) e disjuntiva (DNF).
+Cláusulas e termos são frozensets de literais inteiros (id + 1 da variável, negativo quando negada).
+A distribuição pode crescer exponencialmente (cadeias de XOR); com limit, a conversão desiste e usa uma forma equisatisfatível.
+"""
+
+from __future__ import annotations
+
+from typing import Iterable, Optional
+
+from logic import sat
+from logic.model import Expression, fold, operands
+from logic.model.operators import NOT, AND, OR, IMPLY, EQUAL, XOR, NAND, NOR, join
+from logic.symbols import SymbolTable
+
+"""Prefixo das variáveis auxiliares da forma equisatisfatível; não é um identificador válido, então não colide com as da fórmula."""
+AUXILIARY: str = "#"
+
+
+class SizeLimit(Exception):
+    """A forma normal passaria do limite de cláusulas ou termos."""
+
+
+class NormalForm:
+    """
+    CNF (conjunctive) ou DNF como lista de cláusulas/termos, sem repetições nem subsumidos.
+    equivalent é False quando o limite foi atingido: a forma é só equisatisfatível e pode ter variáveis auxiliares.
+    """
+
+    def __init__(self, sets: Iterable[frozenset[int]], symbols: SymbolTable, conjunctive: bool, equivalent: bool = True):
+        self.sets: list[frozenset[int]] = sorted(sets, key=lambda s: (len(s), sorted(s, key=abs)))
+        self.symbols: SymbolTable = symbols
+        self.conjunctive: bool = conjunctive
+        self.equivalent: bool = equivalent
+
+    def __len__(self) -> int:
+        return len(self.sets)
+
+    def __iter__(self):
+        return iter(self.sets)
+
+    def __repr__(self) -> str:
+        return f"NormalForm({'CNF' if self.conjunctive else 'DNF'}, {self.to_expression().stringify()})"
+
+    def size(self) -> int:
+        """Quantidade total de literais."""
+        return sum(map(len, self.sets))
+
+    def literal(self, lit: int) -> Expression:
+        var: Expression = operands.VAR(self.symbols.name(abs(lit) - 1))
+        return var if lit > 0 else NOT(var)
+
+    def to_expression(self) -> Expression:
+        """Converte para a árvore de logic.model: ∧ de ∨ (CNF) ou ∨ de ∧ (DNF)."""
+        outer, inner = (AND, OR) if self.conjunctive else (OR, AND)
+        return join(outer, tuple(join(inner, tuple(self.literal(lit) for lit in sorted(s, key=abs))) for s in self.sets))
+
+
+def negation_plan(node: Expression, positive: bool, conjunctive: bool) -> tuple:
+    """
+    Como converter o nó com a polaridade indicada:
+    ("leaf", expressão), ("same", nó, polaridade) para repassar a outro nó, ou ("op", tipo, [(filho, polaridade), ...]).
+    EQUAL e XOR são expandidos na forma que evita distribuir depois: ∧ de ∨ para CNF, ∨ de ∧ para DNF.
+    """
+    kind: type = node.type
+    if kind == operands.VAR:
+        return "leaf", node if positive else NOT(node)
+    if kind in (operands.TRUE, operands.FALSE):
+        return "leaf", node if positive else (operands.FALSE() if kind == operands.TRUE else operands.TRUE())
+    if kind == NOT:
+        return "same", node.operand, not positive
+    if kind in (AND, OR):
+        return "op", kind if positive else kind.dual, [(child, positive) for child in node.children]
+    if kind in (NAND, NOR):
+        # ¬(a ∧ b) e ¬(a ∨ b)
+        dual: type = OR if kind == NAND else AND
+        return "op", dual if positive else dual.dual, [(child, not positive) for child in node.children]
+    if kind == IMPLY:
+        # a → b == ¬a ∨ b
+        return "op", OR if positive else AND, [(node.left, not positive), (node.right, positive)]
+    if kind == XOR:
+        return "same", EQUAL(node.left, node.right), not positive
+    if kind == EQUAL:
+        a, b = node.left, node.right
+        if conjunctive:
+            if positive:
+                return "same", AND(OR(NOT(a), b), OR(a, NOT(b))), True
+            return "same", AND(OR(a, b), OR(NOT(a), NOT(b))), True
+        if positive:
+            return "same", OR(AND(a, b), AND(NOT(a), NOT(b))), True
+        return "same", OR(AND(a, NOT(b)), AND(NOT(a), b)), True
+    raise TypeError(f"{type(node).__name__} não pode ser convertido para uma forma normal.")
+
+
+def nnf(expr: Expression, conjunctive: bool = True) -> Expression:
+    """
+    Empurra as negações até os literais em uma passada, sem recursão, deixando só ∧, ∨, ¬ de variáveis e constantes.
+    Cada subárvore é convertida no máximo uma vez por polaridade, então o resultado (compartilhado) tem tamanho linear.
+    """
+    results: dict[tuple[int, bool], Expression] = {}
+    plans: dict[tuple[int, bool], tuple] = {}
+    stack: list[tuple[Expression, bool]] = [(expr, True)]
+    while stack:
+        node, positive = stack.pop()
+        key: tuple[int, bool] = (id(node), positive)
+        if key in results:
+            continue
+        plan: Optional[tuple] = plans.get(key)
+        if plan is None:
+            plan = plans[key] = negation_plan(node, positive, conjunctive)
+            if plan[0] == "leaf":
+                results[key] = plan[1]
+                continue
+            # Volta ao nó depois de converter os filhos
+            stack.append((node, positive))
+            children: list = [plan[1:]] if plan[0] == "same" else plan[2]
+            stack.extend((child, polarity) for child, polarity in reversed(children)
+                         if (id(child), polarity) not in results)
+        elif plan[0] == "same":
+            results[key] = results[(id(plan[1]), plan[2])]
+        else:
+            results[key] = plan[1](*(results[(id(child), polarity)] for child, polarity in plan[2]))
+    return results[(id(expr), True)]
+
+
+def subsume(sets: list[frozenset[int]]) -> list[frozenset[int]]:
+    """
+    Remove repetições e conjuntos que contêm outro (subsumidos).
+    Só um conjunto menor pode subsumir, então cada tamanho é comparado com os menores já mantidos.
+    Cada mantido fica no índice sob um único literal: se k ⊆ s, esse literal está em s.
+    """
+    kept: list[frozenset[int]] = []
+    index: dict[int, list[frozenset[int]]] = {}
+    pending: list[frozenset[int]] = []
+    for s in sorted(set(sets), key=len):
+        if not s:
+            # O conjunto vazio subsume todos
+            return [s]
+        if pending and len(pending[0]) < len(s):
+            for k in pending:
+                min((index.setdefault(lit, []) for lit in k), key=len).append(k)
+            pending = []
+        if any(k <= s for lit in s for k in index.get(lit, ())):
+            continue
+        kept.append(s)
+        pending.append(s)
+    return kept
+
+
+def distribute(left: list[frozenset[int]], right: list[frozenset[int]], limit: Optional[int]) -> list[frozenset[int]]:
+    """Todas as uniões de um conjunto de cada lado, sem as que contêm um literal e sua negação."""
+    if limit is not None and len(left) * len(right) > limit:
+        raise SizeLimit()
+    result: list[frozenset[int]] = []
+    for a in left:
+        for b in right:
+            union: frozenset[int] = a | b
+            if not any(-lit in union for lit in b):
+                result.append(union)
+    return subsume(result)
+
+
+def normal_form(expr: Expression, conjunctive: bool, variables: dict[str, bool] = None,
+                limit: Optional[int] = None) -> NormalForm:
+    """Converte pela NNF, distribuindo o operador interno sobre o externo de baixo para cima."""
+    symbols: SymbolTable = SymbolTable(variables or ())
+    for var in expr.variables():
+        symbols.add(var)
+    outer: type = AND if conjunctive else OR
+    # Constante neutra do operador externo: nenhum conjunto; a absorvente: um conjunto vazio
+    neutral, absorbing = (operands.TRUE, operands.FALSE) if conjunctive else (operands.FALSE, operands.TRUE)
+
+    def step(node: Expression, *children: list[frozenset[int]]) -> list[frozenset[int]]:
+        if node.type == operands.VAR:
+            return [frozenset((symbols[node.var] + 1,))]
+        if node.type == NOT:
+            return [frozenset(-lit for lit in s) for s in children[0]]
+        if node.type == neutral:
+            return []
+        if node.type == absorbing:
+            return [frozenset()]
+        if node.type == outer:
+            result: list[frozenset[int]] = subsume([s for child in children for s in child])
+        else:
+            result = [frozenset()]
+            for child in children:
+                result = distribute(result, child, limit)
+        if limit is not None and len(result) > limit:
+            raise SizeLimit()
+        return result
+
+    try:
+        return NormalForm(fold(nnf(expr, conjunctive), step), symbols, conjunctive)
+    except SizeLimit:
+        return definitional(expr, conjunctive, symbols)
+
+
+def definitional(expr: Expression, conjunctive: bool, symbols: SymbolTable) -> NormalForm:
+    """
+    Forma equisatisfatível de tamanho linear. CNF: a codificação de Tseitin, com as auxiliares nomeadas '#1', '#2', ...
+    DNF: um único termo com um modelo encontrado pelo logic.sat, ou nenhum termo se a fórmula é insatisfatível.
+    """
+    cnf: sat.CNF = sat.tseitin(expr, dict.fromkeys(symbols, True))
+    if conjunctive:
+        inputs: int = len(symbols)
+        for var in range(inputs + 1, cnf.count + 1):
+            symbols.add(f"{AUXILIARY}{var - inputs}")
+        return NormalForm(subsume([frozenset(clause) for clause in cnf.clauses]), symbols, True, False)
+
+    model: Optional[list[bool]] = sat.solve(cnf)
+    if model is None:
+        return NormalForm([], symbols, False, False)
+    return NormalForm([frozenset(var if model[var] else -var for var in range(1, len(symbols) + 1))], symbols, False, False)
+
+
+def to_cnf(expr: Expression, variables: dict[str, bool] = None, limit: Optional[int] = None) -> NormalForm:
+    """Forma normal conjuntiva. Com limit, passando de limit cláusulas usa a codificação de Tseitin."""
+    return normal_form(expr, True, variables, limit)
+
+
+def to_dnf(expr: Expression, variables: dict[str, bool] = None, limit: Optional[int] = None) -> NormalForm:
+    """Forma normal disjuntiva. Com limit, passando de limit termos retorna um único termo satisfatível (ou nenhum)."""
+    return normal_form(expr, False, variables, limit)
+
+
+def main() -> None:
+    from logic.calculator.parser import LogicParser
+
+    parser: LogicParser = LogicParser("(p → q) ⊕ (q ⟷ ¬r)", simplify_expression=False)
+    parser.parse()
+    print(f"NNF: {nnf(parser.expression).stringify()}")
+    print(f"CNF: {to_cnf(parser.expression).to_expression().stringify()}")
+    print(f"DNF: {to_dnf(parser.expression).to_expression().stringify()}")
+
+    parser.expr = " ⊕ ".join(f"x{i}" for i in range(12))
+    parser.parse()
+    print(f"CNF com limite: {to_cnf(parser.expression, limit=256).size()} literais")
+
+
+if __name__ == '__main__':
+    main()
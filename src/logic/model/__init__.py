@@ -4,44 +4,276 @@ Essa seção representa elementos de uma expressão lógica e seus resultados.
 
 from __future__ import annotations
 
+import threading
+import weakref
+import zlib
+from typing import Callable
+
+from logic.cache import LRUCache
+
 """Modelos lógicos"""
 
+"""
+Tabela com todos os nós vivos, indexada pelo hash estrutural (o mesmo objeto int guardado no nó).
+Cada entrada é a referência fraca do nó ou, quando nós diferentes têm o mesmo hash, uma tupla delas;
+nós iguais (p ∧ q e q ∧ p) sempre caem na mesma entrada.
+"""
+intern_table: dict[int, weakref.KeyedRef | tuple] = {}
+
+"""Protege a tabela: entre threads, a busca e a inserção de um nó acontecem juntas. Reentrante porque forget pode rodar durante uma inserção."""
+intern_lock: threading.RLock = threading.RLock()
+
+"""Nós sem argumentos (constantes e padrões) são únicos e nunca descartados."""
+constants: dict[type, Expression] = {}
+
+"""Forma simplificada de cada subárvore, indexada pela identidade do nó (único devido ao hash-consing)."""
+simplify_cache: LRUCache = LRUCache(maxsize=2 ** 16)
+
+"""Forma canônica de cada subárvore, indexada da mesma forma."""
+normalize_cache: LRUCache = LRUCache(maxsize=2 ** 16)
+
+"""Resultados da simplificação em andamento em cada thread. Mantém os filhos até o fim da passada, mesmo que saiam do LRU."""
+simplify_pass: threading.local = threading.local()
+
+
+def bucket(key: int) -> tuple:
+    """Referências guardadas na tabela com o hash."""
+    entry = intern_table.get(key, ())
+    return entry if type(entry) is tuple else (entry,)
+
+
+def store(key: int, refs: tuple) -> None:
+    """Troca a entrada do hash, descartando as referências de nós que já deixaram de existir."""
+    refs = tuple(ref for ref in refs if ref() is not None)
+    if not refs:
+        intern_table.pop(key, None)
+    else:
+        intern_table[key] = refs[0] if len(refs) == 1 else refs
+
+
+def forget(ref: weakref.KeyedRef) -> None:
+    """Remove da tabela um nó que deixou de existir."""
+    with intern_lock:
+        store(ref.key, bucket(ref.key))
+
+
+def lookup(key: int, cls: type, args: tuple):
+    """
+    Nó vivo igual a cls(*args), ou None. Nas folhas os argumentos são comparados por valor;
+    nos operadores, as subexpressões por identidade.
+    """
+    for ref in bucket(key):
+        node = ref()
+        if node is None or type(node) is not cls:
+            continue
+        found: tuple = node.arguments()
+        if cls.leaf:
+            if found == args:
+                return node
+        elif len(found) == len(args) and all(i is j for i, j in zip(found, args)):
+            return node
+    return None
+
+
+def representative(key: int, cls: type, canon: tuple):
+    """Representante dos nós vivos cujas subexpressões canônicas são canon, ou None. Nós iguais têm o mesmo hash."""
+    for ref in bucket(key):
+        node = ref()
+        if node is not None and type(node) is cls:
+            found: tuple = node.canonical_children()
+            if len(found) == len(canon) and all(i is j for i, j in zip(found, canon)):
+                return node._canon
+    return None
+
 
-class Expression:
+class Interned(type):
+    """
+    Metaclasse das expressões (hash-consing).
+    Construir um nó estruturalmente idêntico a um já existente retorna o mesmo objeto imutável, com hash pré-calculado.
+    """
+
+    def __init__(cls, name: str, bases: tuple, namespace: dict, **kwargs):
+        super().__init__(name, bases, namespace, **kwargs)
+        # Resumo do nome da classe, igual em todas as execuções; entra no hash estrutural
+        cls.tag = zlib.crc32(name.encode())
+
+    def __call__(cls, *args):
+        if not args and cls in constants:
+            return constants[cls]
+
+        key: int = cls.structural_hash(*args)
+        node = lookup(key, cls, args)
+        if node is not None:
+            return node
+
+        node = super().__call__(*args)
+        object.__setattr__(node, "_hash", key)
+        # Nós com padrões (ANY) não têm representante: são comparados pela estrutura
+        wild: bool = node.wildcard or any(child._canon is None for child in node.children)
+
+        # Só é publicado com todos os campos preenchidos: outra thread pode encontrá-lo logo em seguida
+        with intern_lock:
+            # Outra thread pode ter publicado o mesmo nó depois da busca; o primeiro publicado é o único
+            found = lookup(key, cls, args)
+            if found is not None:
+                return found
+            # Nós iguais a este (mesmas subexpressões canônicas) compartilham o representante do primeiro; sem nenhum, é o próprio nó
+            canon = None if wild or cls.leaf else representative(key, cls, node.canonical_children())
+            object.__setattr__(node, "_canon", None if wild else node if canon is None else canon)
+            ref: weakref.KeyedRef = weakref.KeyedRef(node, forget, key)
+            store(key, (*bucket(key), ref))
+            if not args:
+                constants[cls] = node
+        return node
+
+
+class Expression(metaclass=Interned):
     """Expressão que represanta ambos Operadores e Operandos."""
 
-    def __init__(self):
-        self.type = type(self)
+    # Sem __dict__: cada nó guarda só os próprios campos; __weakref__ é usado pela tabela de hash-consing.
+    # _canon é o representante dos nós iguais, ou None nos nós que contêm padrões
+    __slots__ = ("_hash", "_canon", "__weakref__")
+
+    # Indica se a expressão é um padrão (ANY) que se iguala a qualquer outra
+    wildcard: bool = False
+    # Folhas são compartilhadas pelo valor de seus argumentos
+    leaf: bool = True
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # O tipo fica na classe, não em cada nó
+        cls.type = cls
 
     def __repr__(self) -> str:
         return f"{type(self).__name__}()"
 
+    def __setattr__(self, name: str, value) -> None:
+        # _canon é o último campo preenchido antes de o nó ser publicado
+        if hasattr(self, "_canon"):
+            raise AttributeError(f"{type(self).__name__} é imutável.")
+        super().__setattr__(name, value)
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} é imutável.")
+
+    def __reduce__(self):
+        # Reconstrói pelo construtor, assim o nó volta a ser compartilhado
+        return type(self), self.arguments()
+
     def __eq__(self, other: Expression):
-        if type(other) == ANY:
+        if self is other or type(other) == ANY:
             return True
+        if not isinstance(other, Expression):
+            return False
+        # Sem padrões, nós iguais compartilham o mesmo representante; a comparação não percorre a árvore
+        if self._canon is not None and other._canon is not None:
+            return self._canon is other._canon
+        return self.equals(other)
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def equals(self, other: Expression) -> bool:
+        """Comparação estrutural, chamada por __eq__ quando não há atalho."""
         return self.type == type(other)
 
+    def arguments(self) -> tuple:
+        """Argumentos do construtor do nó."""
+        return self.children
+
+    @classmethod
+    def structural_hash(cls, *args) -> int:
+        """
+        Calcula o hash a partir do tipo e dos argumentos, antes de o nó existir. Compatível com equals.
+        Igual em todas as execuções (sem hash de strings), então também serve para ordenar operandos.
+        """
+        return hash((cls.tag, *(arg._hash for arg in args)))
+
+    def canonical_children(self) -> tuple:
+        """Subexpressões do representante do nó: os representantes das subexpressões."""
+        return tuple(child._canon for child in self.children)
+
     def __iter__(self):
         yield None
 
+    @property
+    def children(self) -> tuple:
+        """Retorna as subexpressões diretas."""
+        return ()
+
     def evaluate(self, assign: dict = None) -> bool:
         """Calcula o resultado de forma encadeada"""
         return True
 
+    def evaluate_bits(self, assign: dict[str, int], mask: int) -> int:
+        """
+        Calcula todas as linhas de uma vez. Cada variável é um inteiro onde o bit i é seu valor na linha i;
+        mask possui todos os bits das linhas ligados.
+        """
+        return mask
+
     def stringify(self, variables: dict = None) -> str:
         """Mostra a expressão em forma de string"""
         return "()"
 
+    def compile(self, variables: dict[str, bool] = None) -> Callable[..., bool]:
+        """
+        Converte a árvore em uma única função Python, gerada uma vez e sem recursão na chamada.
+        Os argumentos da função são as variáveis em ordem alfabética.
+        """
+        if variables is None:
+            variables = self.variables()
+        names: dict[str, str] = {var: f"v{i}" for i, var in enumerate(sorted(variables))}
+
+        sources: dict[int, str] = {}
+        lines: list[str] = [f"def evaluate({', '.join(names.values())}):"]
+        for node in postorder(self):
+            source: str = node.compile_source(names, *(sources[id(child)] for child in node.children))
+            if node.children:
+                # Cada operador vira uma atribuição; subárvores compartilhadas são calculadas uma vez
+                sources[id(node)] = f"t{len(lines)}"
+                lines.append(f"    t{len(lines)} = {source}")
+            else:
+                sources[id(node)] = source
+        lines.append(f"    return {sources[id(self)]}")
+
+        namespace: dict = {}
+        exec(compile("\n".join(lines), f"<{type(self).__name__}>", "exec"), namespace)
+        return namespace["evaluate"]
+
+    def compile_source(self, names: dict[str, str], *args: str) -> str:
+        """Retorna o código Python do nó, recebendo os nomes já gerados para as subexpressões."""
+        return "True"
+
     def normalize(self):
         return self
 
     def simplify(self) -> Expression:
-        """Após canônizar. Encontrar padrões de simplificações"""
+        """
+        Após canônizar. Encontrar padrões de simplificações. Reaproveita o resultado guardado para a subárvore.
+        As subexpressões são simplificadas antes, de baixo para cima e sem recursão; assim simplify_step só encontra filhos já calculados.
+        """
+        results: dict[int, tuple] = getattr(simplify_pass, "results", None)
+        if results is None:
+            simplify_pass.results = results = {}
+            try:
+                return memoized_fold(self, simplify_cache, results, simplify_node, expand=simplify_operands)
+            finally:
+                simplify_pass.results = None
+        return memoized_fold(self, simplify_cache, results, simplify_node, expand=simplify_operands)
+
+    def simplify_step(self) -> Expression:
+        """Aplica uma passada das simplificações do nó."""
         return self
 
+    def simplify_operands(self) -> tuple:
+        """Subexpressões simplificadas antes do nó na passada de baixo para cima."""
+        return self.children
+
     def negated(self) -> Expression:
         """Retorna forma negada da expressão."""
-        return self
+        from logic.model.operators import NOT
+        return NOT(self)
 
     def variables(self):
         """Retorna todas as varíavies em uma expressão"""
@@ -58,6 +290,8 @@ class Operand(Expression):
     Retorna Verdade/Falso ou uma variável que representa um valor booleano.
     """
 
+    __slots__ = ()
+
 
 class Operator(Expression):
     """
@@ -65,11 +299,174 @@ class Operator(Expression):
     Realiza uma operação com base em operadores/operandos atribuidos
     """
 
+    __slots__ = ()
+
+    leaf = False
+    # Valor de um operando que decide sozinho o resultado (curto-circuito), caso exista
+    decisive: bool = None
+
+    def evaluate(self, assign: dict = None) -> bool:
+        """
+        Calcula o resultado sem recursão, usando a versão bit a bit de cada operador com uma única linha.
+        Operadores com valor decisivo (AND/OR) param no primeiro operando que decide o resultado.
+        """
+        if assign is None:
+            assign = dict()
+        done: dict[int, bool] = {}
+        stack: list[list] = [[self, 0, []]]
+        while stack:
+            frame: list = stack[-1]
+            node, i, values = frame
+            children: tuple = node.children
+            if i == len(children):
+                stack.pop()
+                done[id(node)] = bool(node.bitwise(True, *values))
+                continue
+
+            child: Expression = children[i]
+            if id(child) in done:
+                value: bool = done[id(child)]
+            elif isinstance(child, Operator):
+                # O filho é calculado primeiro; o nó volta a este mesmo índice depois
+                stack.append([child, 0, []])
+                continue
+            else:
+                value = bool(child.evaluate(assign))
+
+            if value is node.decisive:
+                stack.pop()
+                done[id(node)] = value
+            else:
+                frame[1] = i + 1
+                values.append(value)
+        return done[id(self)]
+
+    def evaluate_bits(self, assign: dict[str, int], mask: int) -> int:
+        """Percorre a árvore uma única vez, aplicando uma operação bit a bit por nó."""
+        return fold(self, lambda node, *values: node.bitwise(mask, *values) if isinstance(node, Operator) else node.evaluate_bits(assign, mask))
+
+    def bitwise(self, mask: int, *values: int) -> int:
+        """Versão bit a bit do operador, recebe os resultados já calculados das subexpressões."""
+        return mask
+
+    def stringify(self, variables: dict = None) -> str:
+        """Monta a string sem recursão, expandindo as partes de cada operador em uma pilha."""
+        if variables is None:
+            variables = dict()
+        pieces: list[str] = []
+        stack: list = [self]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, str):
+                pieces.append(item)
+            elif isinstance(item, Operator):
+                stack.extend(reversed(item.layout()))
+            else:
+                pieces.append(item.stringify(variables))
+        return "".join(pieces)
+
+    def layout(self) -> tuple:
+        """Partes da string do operador: textos e subexpressões, na ordem em que aparecem."""
+        return "()",
+
+    def normalize(self) -> Expression:
+        """Converte para a forma canônica de baixo para cima, sem recursão. Subárvores já convertidas são reaproveitadas."""
+        return memoized_fold(self, normalize_cache, {},
+                             lambda node, *args: node.normal_form(*args) if isinstance(node, Operator) else node.normalize())
+
+    def normal_form(self, *args: Expression) -> Expression:
+        """Forma canônica do operador, recebendo as subexpressões já normalizadas."""
+        return self
+
+    def variables(self):
+        """Retorna todas as varíavies em uma expressão, na ordem em que aparecem."""
+        found: dict[str, bool] = {}
+        for node in postorder(self):
+            if not isinstance(node, Operator):
+                found.update(node.variables())
+        return found
+
 
 class ANY(Expression):
+    __slots__ = ()
+
+    wildcard = True
+
     def __eq__(self, other):
         return True
 
+    __hash__ = Expression.__hash__
+
+
+def postorder(expr: Expression):
+    """Percorre a expressão sem recursão, filhos antes dos pais. Subárvores compartilhadas aparecem uma vez."""
+    visited: set[int] = set()
+    stack: list[tuple[Expression, bool]] = [(expr, False)]
+    while stack:
+        node, expanded = stack.pop()
+        if expanded:
+            yield node
+            continue
+        if id(node) in visited:
+            continue
+        visited.add(id(node))
+        stack.append((node, True))
+        for child in reversed(node.children):
+            if id(child) not in visited:
+                stack.append((child, False))
+
+
+def fold(expr: Expression, step: Callable):
+    """
+    Calcula step(nó, *resultados das subexpressões) de baixo para cima, sem recursão.
+    Subárvores compartilhadas são calculadas uma vez.
+    """
+    values: dict[int, object] = {}
+    for node in postorder(expr):
+        values[id(node)] = step(node, *[values[id(child)] for child in node.children])
+    return values[id(expr)]
+
+
+def memoized_fold(expr: Expression, cache: LRUCache, results: dict[int, tuple], step: Callable,
+                  expand: Callable = None) -> Expression:
+    """
+    Como fold, mas guarda (nó, resultado) em cache e não desce em subárvores já calculadas.
+    results mantém os resultados da passada atual, mesmo que saiam do LRU antes de os pais serem calculados.
+    expand escolhe as subexpressões calculadas antes de cada nó (por padrão, children).
+    """
+    if expand is None:
+        expand = children_of
+    stack: list[tuple[Expression, bool]] = [(expr, False)]
+    while stack:
+        node, expanded = stack.pop()
+        if id(node) in results:
+            continue
+        if not expanded:
+            # O nó fica guardado junto do resultado, assim seu id não é reutilizado enquanto estiver guardado
+            entry = cache.get(id(node))
+            if entry is not None:
+                results[id(node)] = entry
+                continue
+            stack.append((node, True))
+            stack.extend((child, False) for child in reversed(expand(node)))
+        else:
+            entry = (node, step(node, *[results[id(child)][1] for child in expand(node)]))
+            results[id(node)] = entry
+            cache.put(id(node), entry)
+    return results[id(expr)][1]
+
+
+def children_of(node: Expression) -> tuple:
+    return node.children
+
+
+def simplify_operands(node: Expression) -> tuple:
+    return node.simplify_operands()
+
+
+def simplify_node(node: Expression, *args: Expression) -> Expression:
+    return node.simplify_step()
+
 
 def simplify(expr: Expression):
     old = None
@@ -2,16 +2,26 @@
 Essa seção modelas os operandos, indicando seus resultados como Verdade, Falso ou uma Variável.
 """
 
-from logic.model import Expression, Operand, ANY
+import zlib
+
+from logic.model import Expression, Operand
 
 """Constantes"""
 class TRUE(Operand):
     """Representa uma constante Verdade."""
 
+    __slots__ = ()
+
     def evaluate(self, assign: dict = None) -> bool:
         """Retorna valor booleano verdade."""
         return True
 
+    def evaluate_bits(self, assign: dict[str, int], mask: int) -> int:
+        return mask
+
+    def compile_source(self, names: dict[str, str], *args: str) -> str:
+        return "True"
+
     def stringify(self, variables: dict = None) -> str:
         return "V"
 
@@ -22,10 +32,18 @@ class TRUE(Operand):
 class FALSE(Operand):
     """Representa uma constante Falso."""
 
+    __slots__ = ()
+
     def evaluate(self, assign: dict = None) -> bool:
         """Retorna valor booleano falso."""
         return False
 
+    def evaluate_bits(self, assign: dict[str, int], mask: int) -> int:
+        return 0
+
+    def compile_source(self, names: dict[str, str], *args: str) -> str:
+        return "False"
+
     def stringify(self, variables: dict = None) -> str:
         return "F"
 
@@ -36,6 +54,8 @@ class FALSE(Operand):
 class VAR(Operand):
     """Representa uma Variável."""
 
+    __slots__ = ("var",)
+
     def __init__(self, var):
         super().__init__()
         self.var = var
@@ -43,10 +63,15 @@ class VAR(Operand):
     def __repr__(self):
         return f"{type(self).__name__}({self.var})"
 
-    def __eq__(self, other):
-        if type(other) == ANY:
-            return True
-        return super().__eq__(other) and self.var == other.var
+    def arguments(self) -> tuple:
+        return self.var,
+
+    def equals(self, other):
+        return super().equals(other) and self.var == other.var
+
+    @classmethod
+    def structural_hash(cls, var) -> int:
+        return hash((cls.tag, zlib.crc32(str(var).encode())))
 
     def evaluate(self, assign: dict = None) -> bool:
         """Durante o calculo é atribuido um valor a partir do dicionario. Caso não atribuido retorna Verdade."""
@@ -56,6 +81,14 @@ class VAR(Operand):
             return assign[self.var]
         return True
 
+    def evaluate_bits(self, assign: dict[str, int], mask: int) -> int:
+        """Retorna os bits atribuidos à variável. Caso não atribuida retorna Verdade em todas as linhas."""
+        return assign.get(self.var, mask)
+
+    def compile_source(self, names: dict[str, str], *args: str) -> str:
+        """Retorna o argumento da variável. Caso não atribuida retorna Verdade."""
+        return names.get(self.var, "True")
+
     def stringify(self, variables: dict = None) -> str:
         """Retorna em forma de string o valor atribuido no dicionario ou sua chave interna."""
         if variables is None:
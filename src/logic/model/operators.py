@@ -2,13 +2,16 @@
 Nesta seção é modelado os operados unários e binários.
 """
 
-from logic.model import Operator, Expression, ANY
+from logic.model import Operator, Expression
 from logic.model.operands import TRUE, FALSE, VAR
+from logic.model.rewrite import RuleTable
 
 """Operadores unários"""
 class UNARY(Operator):
     """Representa um Operador unário."""
 
+    __slots__ = ("operand",)
+
     def __init__(self, operand: Expression):
         super().__init__()
         self.operand = operand
@@ -16,33 +19,27 @@ class UNARY(Operator):
     def __repr__(self) -> str:
         return f"{type(self).__name__}({self.operand})"
 
-    def __eq__(self, other: Expression):
-        if type(other) == ANY:
-            return True
-        elif issubclass(type(other), UNARY):
-            return super().__eq__(other) and self.operand == other.operand
+    def equals(self, other: Expression):
+        if issubclass(type(other), UNARY):
+            return super().equals(other) and self.operand == other.operand
         return False
 
     def __iter__(self):
         yield self.operand
 
-    def evaluate(self, assign: dict = None) -> bool:
-        return True
+    @property
+    def children(self) -> tuple:
+        return self.operand,
 
-    def stringify(self, variables: dict = None) -> str:
-        if variables is None:
-            variables = dict()
-        return self.operand.stringify(variables)
+    def layout(self) -> tuple:
+        return self.operand,
 
-    def normalize(self):
-        return type(self)(self.operand.normalize())
+    def normal_form(self, operand: Expression) -> Expression:
+        return type(self)(operand)
 
-    def simplify(self):
+    def simplify_step(self):
         return type(self)(self.operand.simplify())
 
-    def variables(self):
-        return self.operand.variables()
-
     def find(self, predicate):
         """Retorna o elemento com tipo igual e um diferente"""
         if predicate(self.operand.type):
@@ -53,18 +50,19 @@ class UNARY(Operator):
 class NOT(UNARY):
     """Representa um Operador unário de negação."""
 
+    __slots__ = ()
+
     def __init__(self, operand: Expression):
         super().__init__(operand)
 
-    def evaluate(self, assign: dict = None) -> bool:
-        if assign is None:
-            assign = dict()
-        return not self.operand.evaluate(assign)
+    def bitwise(self, mask: int, operand: int) -> int:
+        return mask ^ operand
 
-    def stringify(self, variables: dict = None) -> str:
-        if variables is None:
-            variables = dict()
-        return f"¬{self.operand.stringify(variables)}"
+    def compile_source(self, names: dict[str, str], operand: str) -> str:
+        return f"not {operand}"
+
+    def layout(self) -> tuple:
+        return "¬", self.operand
 
     def equivalences(self) -> list:
         return [
@@ -72,24 +70,22 @@ class NOT(UNARY):
             NOR(self.operand, self.operand)
         ]
 
-    def simplify(self) -> Expression:
-        if self.operand.type == NOT:
-            return self.operand.operand.simplify()
-        elif self.operand.type == TRUE:
-            return FALSE()
-        elif self.operand.type == FALSE:
-            return TRUE()
-
-        return super().simplify()
+    def simplify_step(self) -> Expression:
+        result = rules.apply(self)
+        if result is not None:
+            return result
+        return super().simplify_step()
 
     def negated(self) -> Expression:
-        return self.operand.negated()
+        return self.operand
 
 
 """Operadores binários"""
 class BINARY(Operator):
     """Representa um Operador binário."""
 
+    __slots__ = ("left", "right")
+
     def __init__(self, left: Expression, right: Expression):
         super().__init__()
         self.left = left
@@ -98,39 +94,35 @@ class BINARY(Operator):
     def __repr__(self) -> str:
         return f"{type(self).__name__}({self.left}, {self.right})"
 
-    def __eq__(self, other: Expression):
-        if type(other) == ANY:
-            return True
-        elif issubclass(type(other), BINARY):
-            return super().__eq__(other) and self.left == other.left and self.right == other.right
+    def equals(self, other: Expression):
+        if issubclass(type(other), BINARY):
+            return super().equals(other) and self.left == other.left and self.right == other.right
         return False
 
     def __iter__(self):
         yield self.left
         yield self.right
 
-    def evaluate(self, assign: dict = None) -> bool:
-        return True
+    @property
+    def children(self) -> tuple:
+        return self.left, self.right
 
-    def stringify(self, variables: dict = None) -> str:
-        if variables is None:
-            variables = dict()
-        return f"({self.left.stringify(variables)} {self.right.stringify(variables)})"
+    def layout(self) -> tuple:
+        return "(", self.left, " ", self.right, ")"
 
     def equivalences(self) -> list:
         return [NOT(self.negated())]
 
-    def normalize(self):
-        return type(self)(self.left.normalize(), self.right.normalize())
+    def normal_form(self, left: Expression, right: Expression) -> Expression:
+        return type(self)(left, right)
 
-    def simplify(self) -> Expression:
-        return type(self)(self.left.simplify(), self.right.simplify())
+    def simplify_operands(self) -> tuple:
+        # Os operadores binários são simplificados pela forma normal da subárvore inteira, sem as formas intermediárias
+        # de cada nível: em p → (q → (r → ...)) cada nível seria um ∨ com todos os operandos de baixo, achatado de novo
+        return ()
 
-    def variables(self):
-        t = {}
-        t.update(self.left.variables())
-        t.update(self.right.variables())
-        return t
+    def simplify_step(self) -> Expression:
+        return type(self)(self.left.simplify(), self.right.simplify())
 
     def find(self, predicate):
         """Retorna o elemento com tipo igual e um diferente"""
@@ -142,222 +134,159 @@ class BINARY(Operator):
         return found, not_found
 
 
-class AND(BINARY):
-    """Representa um Operador binário de conjunção."""
+"""Operadores associativos"""
+class NARY(Operator):
+    """
+    Representa um Operador associativo e comutativo com qualquer quantidade de operandos.
+    A simplificação junta cadeias do mesmo operador em um único nó, com operandos únicos e ordenados.
+    """
 
-    def __init__(self, left: Expression, right: Expression):
-        super().__init__(left, right)
+    __slots__ = ("operands",)
 
-    def __eq__(self, other):
-        if type(other) == ANY:
-            return True
-        elif self.type == type(other):
-            return (self.left == other.left and self.right == other.right) or (self.left == other.right and self.right == other.left)
-        return False
+    symbol: str = ""
+    # Operando que não altera o resultado e operando que decide o resultado sozinho
+    neutral: type = None
+    absorbing: type = None
+    # Operador com elemento neutro e absorvente trocados (usado na negação e na absorção)
+    dual: type = None
 
-    def evaluate(self, assign: dict = None) -> bool:
-        if assign is None:
-            assign = dict()
-        return self.left.evaluate(assign) and self.right.evaluate(assign)
-
-    def stringify(self, variables: dict = None) -> str:
-        if variables is None:
-            variables = dict()
-        return f"({self.left.stringify(variables)} ∧ {self.right.stringify(variables)})"
-
-    def simplify(self) -> Expression:
-        # Idempotentes
-        if self.left == self.right:
-            return self.left.simplify()
-
-        elif self.left in self.right.equivalences():
-            return self.right.simplify()
-
-        elif self.right in self.left.equivalences():
-            return self.left.simplify()
-
-        # Contradição
-        elif self.is_false():
-            return FALSE()
-
-        # Neutro
-        elif TRUE() in self:
-            not_true = next(filter(lambda x: x != TRUE(), self))
-            return not_true.simplify()
-
-        elif self.left == NOT(self.right.negated().simplify()):
-            return self.right.simplify()
-        elif self.right == NOT(self.left.negated().simplify()):
-            return self.left.simplify()
-
-        # Absorção
-        elif self == AND(self.left, OR(self.left, ANY())):
-            return self.left.simplify()
-        elif self == AND(self.right, OR(self.right, ANY())):
-            return self.right.simplify()
-
-        # Associativa p ^ (p ^ q) == (p ^ p) ^ q
-        elif self == AND(self.left, AND(self.left, ANY())):
-            found_AND, not_AND = self.find(lambda x: x.type == AND)
-            AND_not_left, _ = found_AND.find(lambda x: x != not_AND)
-            return AND(not_AND, AND_not_left).simplify()
-
-        # Associativa (p ^ q) ^ q == p ^ (q ^ q)
-        elif self == AND(self.right, AND(self.right, ANY())):
-            found_AND, not_AND = self.find(lambda x: x.type == AND)
-            AND_not_right, _ = found_AND.find(lambda x: x != not_AND)
-            return AND(AND_not_right, not_AND).simplify()
-
-        return super().simplify()
+    def __init__(self, *operands: Expression):
+        super().__init__()
+        self.operands = operands
 
-    def is_false(self):
-        if FALSE() in self:
-            return True
-        elif self == AND(NOT(self.left), self.left):
-            return True
-        elif self == AND(NOT(self.right), self.right):
-            return True
-
-        # Associativa
-        elif self.left.type == self.type:
-            if NOT(self.right) in self.left:
-                return True
-            for i in self.left:
-                if NOT(i) == self.right:
-                    return True
-        elif self.right.type == self.type:
-            if NOT(self.left) in self.right:
-                return True
-            for i in self.right:
-                if NOT(i) == self.left:
-                    return True
-        return False
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({', '.join(map(str, self.operands))})"
+
+    def equals(self, other: Expression):
+        if self.type != type(other):
+            return False
+        # A ordem e a repetição dos operandos não alteram o resultado
+        if self._canon is not None and other._canon is not None:
+            return frozenset(self.operands) == frozenset(other.operands)
+        return all(any(i == j for j in other.operands) for i in self.operands) and \
+            all(any(j == i for i in self.operands) for j in other.operands)
+
+    @classmethod
+    def structural_hash(cls, *operands: Expression) -> int:
+        # Comutativo e idempotente: a ordem e a repetição dos operandos não alteram o hash
+        return hash((cls.tag, *sorted({operand._hash for operand in operands})))
+
+    def canonical_children(self) -> tuple:
+        # Representantes únicos em uma ordem fixa; nós que diferem só na ordem ou repetição ficam iguais
+        return tuple(sorted({id(operand._canon): operand._canon for operand in self.operands}.values(), key=id))
+
+    def __iter__(self):
+        yield from self.operands
+
+    @property
+    def children(self) -> tuple:
+        return self.operands
+
+    def layout(self) -> tuple:
+        parts: list = ["("]
+        for i, operand in enumerate(self.operands):
+            if i:
+                parts.append(f" {self.symbol} ")
+            parts.append(operand)
+        parts.append(")")
+        return tuple(parts)
+
+    def normal_form(self, *operands: Expression) -> Expression:
+        return type(self)(*operands)
+
+    def simplify_operands(self) -> tuple:
+        # Cadeias do mesmo operador são achatadas antes; os nós intermediários não são simplificados
+        return flatten(self)
+
+    def simplify_step(self) -> Expression:
+        # Associativa, idempotente e elemento neutro: p ∧ (q ∧ p) ∧ V == p ∧ q, antes das demais regras
+        node: Expression = join(type(self), flatten(type(self)(*(operand.simplify() for operand in flatten(self)))))
+        if node is not self:
+            return node.simplify()
+        result = rules.apply(self)
+        return self if result is None else result
+
+    def is_absorbed(self) -> bool:
+        """Verifica se o resultado é o elemento absorvente: contém o absorvente ou um operando e sua negação."""
+        present: set = set(self.operands)
+        return any(operand.type == self.absorbing or (operand.type == NOT and operand.operand in present)
+                   for operand in self.operands)
 
     def negated(self) -> Expression:
-        return OR(NOT(self.left), NOT(self.right))
+        return self.dual(*(NOT(operand) for operand in self.operands))
 
     def equivalences(self) -> list:
         return [
-            NOT(OR(NOT(self.left), NOT(self.right)))
+            NOT(self.negated())
         ]
 
 
-class OR(BINARY):
-    """Representa um Operador binário de disjunção."""
-
-    def __init__(self, left: Expression, right: Expression):
-        super().__init__(left, right)
-
-    def __eq__(self, other):
-        if type(other) == ANY:
-            return True
-        elif self.type == type(other):
-            return (self.left == other.left and self.right == other.right) or (self.left == other.right and self.right == other.left)
-        return False
-
-    def evaluate(self, assign: dict = None) -> bool:
-        if assign is None:
-            assign = dict()
-        return self.left.evaluate(assign) or self.right.evaluate(assign)
+class AND(NARY):
+    """Representa um Operador de conjunção."""
 
-    def stringify(self, variables: dict = None) -> str:
-        if variables is None:
-            variables = dict()
-        return f"({self.left.stringify(variables)} ∨ {self.right.stringify(variables)})"
+    __slots__ = ()
 
-    def simplify(self) -> Expression:
-        # Idempotentes
-        if self.left == self.right:
-            return self.left.simplify()
+    symbol = "∧"
+    neutral = TRUE
+    absorbing = FALSE
+    decisive = False
 
-        elif self.left in self.right.equivalences():
-            return self.right.simplify()
+    def bitwise(self, mask: int, *values: int) -> int:
+        result: int = mask
+        for value in values:
+            result &= value
+        return result
 
-        elif self.right in self.left.equivalences():
-            return self.left.simplify()
+    def compile_source(self, names: dict[str, str], *args: str) -> str:
+        return " and ".join(args)
 
-        # Tautologia
-        elif self.is_true():
-            return TRUE()
+    def is_false(self):
+        return self.is_absorbed()
 
-        elif self.left == NOT(self.right.negated().simplify()):
-            return self.right.simplify()
-        elif self.right == NOT(self.left.negated().simplify()):
-            return self.left.simplify()
 
-        # Neutro
-        elif FALSE() in self:
-            return self.left.simplify() if self.left.type != FALSE else self.right.simplify()
+class OR(NARY):
+    """Representa um Operador de disjunção."""
 
-        # Absorção
-        elif self == OR(self.left, AND(self.left, ANY())):
-            return self.left.simplify()
-        elif self == OR(self.right, AND(self.right, ANY())):
-            return self.right.simplify()
+    __slots__ = ()
 
-        # Associativa p v (p v q) == (p v p) v q
-        elif self == OR(self.left, OR(self.left, ANY())):
-            found_or, not_or = self.find(lambda x: x.type == OR)
-            or_not_left, _ = found_or.find(lambda x: x != not_or)
-            return OR(not_or, or_not_left).simplify()
+    symbol = "∨"
+    neutral = FALSE
+    absorbing = TRUE
+    decisive = True
 
-        # Associativa (p v q) v q == p v (q v q)
-        elif self == OR(self.right, OR(self.right, ANY())):
-            found_or, not_or = self.find(lambda x: x.type == OR)
-            or_not_left, _ = found_or.find(lambda x: x != not_or)
-            return OR(or_not_left, not_or).simplify()
+    def bitwise(self, mask: int, *values: int) -> int:
+        result: int = 0
+        for value in values:
+            result |= value
+        return result
 
-        return super().simplify()
+    def compile_source(self, names: dict[str, str], *args: str) -> str:
+        return " or ".join(args)
 
     def is_true(self):
-        # Tautologia
-        if TRUE() in self:
-            return True
-        elif self == OR(NOT(self.right), self.right):
-            return True
-        elif self == OR(NOT(self.left), self.left):
-            return True
-
-        # Associativa
-        elif self.left.type == OR:
-            if NOT(self.right) in self.left:
-                return True
-            for i in self.left:
-                if NOT(i) == self.right:
-                    return True
-        elif self.right.type == OR:
-            if NOT(self.left) in self.right:
-                return True
-            for i in self.right:
-                if NOT(i) == self.left:
-                    return True
+        return self.is_absorbed()
 
-        return False
 
-    def negated(self) -> Expression:
-        return AND(NOT(self.left), NOT(self.right))
-
-    def equivalences(self) -> list:
-        return [
-            NOT(AND(NOT(self.left), NOT(self.right)))
-        ]
+AND.dual = OR
+OR.dual = AND
 
 
 class IMPLY(BINARY):
     """Representa um Operador binário de implicação."""
 
+    __slots__ = ()
+
     def __init__(self, left: Expression, right: Expression):
         super().__init__(left, right)
 
-    def evaluate(self, assign: dict = None) -> bool:
-        if assign is None:
-            assign = dict()
-        return not self.left.evaluate(assign) or self.right.evaluate(assign)
+    def bitwise(self, mask: int, left: int, right: int) -> int:
+        return (mask ^ left) | right
+
+    def compile_source(self, names: dict[str, str], left: str, right: str) -> str:
+        return f"not {left} or {right}"
 
-    def stringify(self, variables: dict = None) -> str:
-        if variables is None:
-            variables = dict()
-        return f"({self.left.stringify(variables)} → {self.right.stringify(variables)})"
+    def layout(self) -> tuple:
+        return "(", self.left, " → ", self.right, ")"
 
     def equivalences(self) -> list:
         return [
@@ -365,56 +294,59 @@ class IMPLY(BINARY):
             NOT(AND(self.left, NOT(self.right)))
         ]
 
-    def normalize(self):
-        return OR(NOT(self.left), self.right).normalize()
+    def normal_form(self, left: Expression, right: Expression) -> Expression:
+        return OR(NOT(left), right)
 
-    def simplify(self) -> Expression:
+    def simplify_step(self) -> Expression:
         return self.normalize().simplify()
 
 
 class EQUAL(BINARY):
     """Representa um Operador binário de equivalência."""
 
+    __slots__ = ()
+
     def __init__(self, left: Expression, right: Expression):
         super().__init__(left, right)
 
-    def evaluate(self, assign: dict = None) -> bool:
-        if assign is None:
-            assign = dict()
-        return self.left.evaluate(assign) == self.right.evaluate(assign)
+    def bitwise(self, mask: int, left: int, right: int) -> int:
+        return mask ^ (left ^ right)
+
+    def compile_source(self, names: dict[str, str], left: str, right: str) -> str:
+        return f"{left} == {right}"
 
-    def stringify(self, variables: dict = None) -> str:
-        if variables is None:
-            variables = dict()
-        return f"({self.left.stringify(variables)} ⟷ {self.right.stringify(variables)})"
+    def layout(self) -> tuple:
+        return "(", self.left, " ⟷ ", self.right, ")"
 
     def equivalences(self) -> list:
         return [
             AND(IMPLY(self.left, self.right), IMPLY(self.right, self.left)),
         ]
 
-    def normalize(self):
-        return AND(IMPLY(self.left, self.right), IMPLY(self.right, self.left)).normalize()
+    def normal_form(self, left: Expression, right: Expression) -> Expression:
+        # AND(IMPLY(left, right), IMPLY(right, left)) já normalizado
+        return AND(OR(NOT(left), right), OR(NOT(right), left))
 
-    def simplify(self) -> Expression:
+    def simplify_step(self) -> Expression:
         return self.normalize().simplify()
 
 
 class NAND(BINARY):
     """Representa um Operador binário de negação de conjunção."""
 
+    __slots__ = ()
+
     def __init__(self, left: Expression, right: Expression):
         super().__init__(left, right)
 
-    def evaluate(self, assign: dict = None) -> bool:
-        if assign is None:
-            assign = dict()
-        return not (self.left.evaluate(assign) and self.right.evaluate(assign))
+    def bitwise(self, mask: int, left: int, right: int) -> int:
+        return mask ^ (left & right)
 
-    def stringify(self, variables: dict = None) -> str:
-        if variables is None:
-            variables = dict()
-        return f"({self.left.stringify(variables)} ↑ {self.right.stringify(variables)})"
+    def compile_source(self, names: dict[str, str], left: str, right: str) -> str:
+        return f"not ({left} and {right})"
+
+    def layout(self) -> tuple:
+        return "(", self.left, " ↑ ", self.right, ")"
 
     def equivalences(self) -> list:
         return [
@@ -422,28 +354,29 @@ class NAND(BINARY):
             OR(NOT(self.left), NOT(self.right))
         ]
 
-    def normalize(self):
-        return NOT(AND(self.left, self.right)).normalize()
+    def normal_form(self, left: Expression, right: Expression) -> Expression:
+        return NOT(AND(left, right))
 
-    def simplify(self) -> Expression:
+    def simplify_step(self) -> Expression:
         return self.normalize().simplify()
 
 
 class NOR(BINARY):
     """Representa um Operador binário de negação de disjunção."""
 
+    __slots__ = ()
+
     def __init__(self, left: Expression, right: Expression):
         super().__init__(left, right)
 
-    def evaluate(self, assign: dict = None) -> bool:
-        if assign is None:
-            assign = dict()
-        return not (self.left.evaluate(assign) or self.right.evaluate(assign))
+    def bitwise(self, mask: int, left: int, right: int) -> int:
+        return mask ^ (left | right)
 
-    def stringify(self, variables: dict = None) -> str:
-        if variables is None:
-            variables = dict()
-        return f"({self.left.stringify(variables)} ↓ {self.right.stringify(variables)})"
+    def compile_source(self, names: dict[str, str], left: str, right: str) -> str:
+        return f"not ({left} or {right})"
+
+    def layout(self) -> tuple:
+        return "(", self.left, " ↓ ", self.right, ")"
 
     def equivalences(self) -> list:
         return [
@@ -451,28 +384,29 @@ class NOR(BINARY):
             AND(NOT(self.left), NOT(self.right))
         ]
 
-    def normalize(self):
-        return NOT(OR(self.left, self.right)).normalize()
+    def normal_form(self, left: Expression, right: Expression) -> Expression:
+        return NOT(OR(left, right))
 
-    def simplify(self) -> Expression:
+    def simplify_step(self) -> Expression:
         return self.normalize().simplify()
 
 
 class XOR(BINARY):
     """Representa um Operador binário de disjunção exclusiva."""
 
+    __slots__ = ()
+
     def __init__(self, left: Expression, right: Expression):
         super().__init__(left, right)
 
-    def evaluate(self, assign: dict = None) -> bool:
-        if assign is None:
-            assign = dict()
-        return not (self.left.evaluate(assign) == self.right.evaluate(assign))
+    def bitwise(self, mask: int, left: int, right: int) -> int:
+        return left ^ right
+
+    def compile_source(self, names: dict[str, str], left: str, right: str) -> str:
+        return f"{left} != {right}"
 
-    def stringify(self, variables: dict = None) -> str:
-        if variables is None:
-            variables = dict()
-        return f"({self.left.stringify(variables)} ⊻ {self.right.stringify(variables)})"
+    def layout(self) -> tuple:
+        return "(", self.left, " ⊻ ", self.right, ")"
 
     def equivalences(self) -> list:
         return [
@@ -480,14 +414,143 @@ class XOR(BINARY):
             AND(OR(self.left, self.right), NOT(AND(self.left, self.right)))
         ]
 
-    def normalize(self):
-        # return NOT(EQUAL(self.left, self.right)).normalize()
-        return AND(OR(self.left, self.right), NOT(AND(self.left, self.right))).normalize()
+    def normal_form(self, left: Expression, right: Expression) -> Expression:
+        return AND(OR(left, right), NOT(AND(left, right)))
 
-    def simplify(self) -> Expression:
+    def simplify_step(self) -> Expression:
         return self.normalize().simplify()
 
 
+"""Regras de simplificação"""
+rules: RuleTable = RuleTable()
+
+# Tipos que podem aparecer em equivalences() de cada operador; evita construir as equivalências sem necessidade
+equivalence_kinds: dict[type, set] = {
+    NOT: {NAND, NOR},
+    BINARY: {NOT},
+    AND: {NOT},
+    OR: {NOT},
+    IMPLY: {OR, NOT},
+    EQUAL: {AND},
+    NAND: {NOT, OR},
+    NOR: {NOT, AND},
+    XOR: {NOT, AND},
+}
+
+
+"""Tipos cuja forma negada é construída sem simplificar subexpressões novas."""
+negatable: tuple = (NOT, AND, OR, TRUE, FALSE, VAR)
+
+
+def sort_key(expr: Expression) -> tuple:
+    """Ordem dos operandos: constantes, literais pelo nome da variável (p antes de ¬p) e as demais pelo hash estrutural."""
+    if expr.type == VAR:
+        return 1, expr.var, 0, 0
+    if expr.type == NOT and expr.operand.type == VAR:
+        return 1, expr.operand.var, 1, 0
+    return (0 if expr.leaf else 2), "", 0, expr._hash
+
+
+def join(kind: type, operands: tuple) -> Expression:
+    """Constroi o operador n-ário. Sem operandos retorna o elemento neutro; com um, o próprio operando."""
+    if not operands:
+        return kind.neutral()
+    if len(operands) == 1:
+        return operands[0]
+    return kind(*operands)
+
+
+def operand_index(expr: NARY) -> dict:
+    """Operandos de expr indexados por eles mesmos; achar um operando igual a outra expressão custa um hash."""
+    index: dict = {}
+    for operand in expr.operands:
+        index.setdefault(operand, operand)
+    return index
+
+
+def other_equal(index: dict, target: Expression, operand: Expression):
+    """Retorna o operando do índice, diferente de operand, igual a target; ou None."""
+    found = index.get(target)
+    return None if found is operand else found
+
+
+def without(expr: NARY, removed: Expression) -> Expression:
+    """Retorna o operador sem o operando indicado (comparado por identidade)."""
+    return join(type(expr), tuple(operand for operand in expr.operands if operand is not removed))
+
+
+def flatten(expr: NARY) -> tuple:
+    """Operandos com as cadeias do mesmo operador expandidas, sem repetições nem elementos neutros, ordenados."""
+    found: list[Expression] = []
+    seen: set = set()
+    stack: list[Expression] = list(reversed(expr.operands))
+    while stack:
+        operand: Expression = stack.pop()
+        if operand.type == expr.type:
+            stack.extend(reversed(operand.operands))
+        elif operand.type != expr.neutral and operand not in seen:
+            seen.add(operand)
+            found.append(operand)
+    return tuple(sorted(found, key=sort_key))
+
+
+def absorbing(expr: NARY):
+    if expr.is_absorbed():
+        return expr.absorbing()
+
+
+def absorption(expr: NARY):
+    # p ∧ (p ∨ q) == p
+    present: set = set(expr.operands)
+    kept: tuple = tuple(operand for operand in expr.operands
+                        if not (operand.type == expr.dual and any(i in present for i in operand.operands)))
+    if len(kept) != len(expr.operands):
+        return join(type(expr), kept).simplify()
+
+
+def de_morgan(expr: NARY):
+    index: dict = operand_index(expr)
+    kinds: set = set(map(type, expr.operands))
+    for operand in expr.operands:
+        if not kinds & equivalence_kinds.get(operand.type, set()):
+            continue
+        for equivalent in operand.equivalences():
+            found = other_equal(index, equivalent, operand)
+            if found is not None:
+                return without(expr, found).simplify()
+
+
+def double_negation(expr: NARY):
+    # ¬x junto de um operando equivalente a ¬x: basta o operando
+    index: dict = operand_index(expr)
+    for operand in expr.operands:
+        # Só compara com operandos cuja negação é direta; negar outros operadores custa uma simplificação inteira
+        if operand.type not in negatable:
+            continue
+        target: Expression = NOT(operand.negated().simplify())
+        # Para ¬x o alvo é o próprio operando (os nós são únicos); os iguais a ele já foram removidos por flatten
+        if target == operand:
+            continue
+        found = other_equal(index, target, operand)
+        if found is not None:
+            return without(expr, found).simplify()
+
+
+rules.register(NOT, "dupla negação", lambda expr: expr.operand.operand.simplify(), kinds=(NOT,))
+rules.register(NOT, "negação de verdade", lambda expr: FALSE(), kinds=(TRUE,))
+rules.register(NOT, "negação de falso", lambda expr: TRUE(), kinds=(FALSE,))
+
+rules.register(AND, "contradição", absorbing)
+rules.register(AND, "absorção", absorption, kinds=(OR,))
+rules.register(AND, "de morgan", de_morgan)
+rules.register(AND, "dupla negação", double_negation, kinds=(NOT,))
+
+rules.register(OR, "tautologia", absorbing)
+rules.register(OR, "absorção", absorption, kinds=(AND,))
+rules.register(OR, "de morgan", de_morgan)
+rules.register(OR, "dupla negação", double_negation, kinds=(NOT,))
+
+
 def main() -> None:
     keys = dict(p='A', q='B')
     values = dict(p=False, q=False)
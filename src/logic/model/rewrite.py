@@ -0,0 +1,66 @@
+"""
+Motor de reescrita. Regras declarativas indexadas pelo operador raiz e pelos tipos de suas subexpressões.
+"""
+
+from __future__ import annotations
+
+from typing import Callable, Optional
+
+from logic.model import Expression
+
+
+class Rule:
+    """
+    Representa uma regra de reescrita.
+    action recebe o nó e retorna a expressão reescrita, ou None quando a regra não se aplica.
+    kinds são os tipos que precisam aparecer entre as subexpressões para a regra ser tentada.
+    """
+
+    def __init__(self, name: str, action: Callable[[Expression], Optional[Expression]], kinds: tuple = ()):
+        self.name: str = name
+        self.action: Callable[[Expression], Optional[Expression]] = action
+        self.kinds: frozenset = frozenset(kinds)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.name})"
+
+
+class RuleTable:
+    """Guarda as regras de cada operador na ordem em que foram registradas."""
+
+    def __init__(self):
+        self.rules: dict[type, list[Rule]] = {}
+        # (tipo do nó, conjunto dos tipos das subexpressões) -> regras aplicáveis
+        self.index: dict[tuple, list[Rule]] = {}
+
+    def register(self, root: type, name: str, action: Callable[[Expression], Optional[Expression]], kinds: tuple = ()) -> Rule:
+        """Adiciona uma regra ao final das regras do operador."""
+        rule: Rule = Rule(name, action, kinds)
+        self.rules.setdefault(root, []).append(rule)
+        self.index.clear()
+        return rule
+
+    def rule(self, root: type, name: str, kinds: tuple = ()) -> Callable:
+        """Decorador para registrar uma função como regra."""
+        def decorator(action: Callable[[Expression], Optional[Expression]]) -> Callable:
+            self.register(root, name, action, kinds)
+            return action
+        return decorator
+
+    def candidates(self, node: Expression) -> list[Rule]:
+        """Retorna somente as regras cujos tipos exigidos aparecem nas subexpressões do nó."""
+        # Só o conjunto de tipos importa; operadores n-ários teriam chaves de qualquer tamanho
+        key: tuple = (type(node), frozenset(map(type, node.children)))
+        found: Optional[list[Rule]] = self.index.get(key)
+        if found is None:
+            found = [rule for rule in self.rules.get(key[0], []) if rule.kinds <= key[1]]
+            self.index[key] = found
+        return found
+
+    def apply(self, node: Expression) -> Optional[Expression]:
+        """Aplica a primeira regra que se encaixar. Retorna None caso nenhuma se aplique."""
+        for rule in self.candidates(node):
+            result: Optional[Expression] = rule.action(node)
+            if result is not None:
+                return result
+        return None
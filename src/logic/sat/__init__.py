@@ -0,0 +1,81 @@
+"""
+Satisfatibilidade sem tabela verdade: codifica a expressão em CNF (Tseitin) e resolve com um CDCL.
+Atende fórmulas com centenas de variáveis, onde a tabela verdade (2^n linhas) ou o BDD não cabem.
+Também conta modelos (#SAT) e calcula probabilidades pela decomposição em componentes da mesma CNF.
+"""
+
+from typing import Optional
+
+from logic.model import Expression
+from logic.model.operators import NOT
+from logic.sat.cdcl import Solver
+from logic.sat.cnf import CNF, tseitin
+from logic.sat.count import Counter
+
+
+def solve(cnf: CNF) -> Optional[list[bool]]:
+    """Resolve a CNF. Retorna o valor de cada variável (índice 0 sem uso) ou None se for insatisfatível."""
+    solver: Solver = Solver(cnf.count, cnf.clauses)
+    if not solver.solve():
+        return None
+    return solver.model()
+
+
+def satisfy(expr: Expression, variables: dict[str, bool] = None) -> Optional[dict[str, bool]]:
+    """Retorna uma atribuição (no formato aceito por evaluate) que torna a expressão verdadeira, ou None."""
+    cnf: CNF = tseitin(expr, variables)
+    model: Optional[list[bool]] = solve(cnf)
+    if model is None:
+        return None
+    return cnf.assignment(model)
+
+
+def is_satisfiable(expr: Expression, variables: dict[str, bool] = None) -> bool:
+    """Verifica se existe atribuição que torna a expressão verdadeira."""
+    return satisfy(expr, variables) is not None
+
+
+def is_tautology(expr: Expression, variables: dict[str, bool] = None) -> bool:
+    """Verifica se a expressão é sempre verdadeira: sua negação é insatisfatível."""
+    return not is_satisfiable(NOT(expr), variables)
+
+
+def count_models(expr: Expression, variables: dict[str, bool] = None) -> int:
+    """Quantidade de linhas verdadeiras da tabela verdade sobre as variáveis indicadas, sem gerá-la."""
+    cnf: CNF = tseitin(expr, variables)
+    return Counter(cnf.count, cnf.clauses, [1] * (2 * cnf.count + 1), len(cnf.names)).run()
+
+
+def probability(expr: Expression, p: dict[str, float], variables: dict[str, bool] = None):
+    """
+    Probabilidade da expressão ser verdadeira com cada variável verdadeira independentemente com probabilidade p[nome].
+    Variáveis ausentes de p valem 1/2. Aceita float ou Fraction (resultado exato).
+    """
+    cnf: CNF = tseitin(expr, variables)
+    # As auxiliares de Tseitin são definidas pelas variáveis da expressão e valem 1
+    weights: list = [1] * (2 * cnf.count + 1)
+    for name, var in cnf.names.items():
+        weights[var] = p.get(name, 0.5)
+        weights[-var] = 1 - weights[var]
+    return Counter(cnf.count, cnf.clauses, weights, len(cnf.names)).run()
+
+
+def main() -> None:
+    from logic.calculator.parser import LogicParser
+
+    parser: LogicParser = LogicParser("(en_1 → ready) ∧ (ready → ¬en_2) ∧ en_1 ∧ en_2", simplify_expression=False)
+    parser.parse()
+    print(f"Satisfatível: {satisfy(parser.expression, parser.variables)}")
+
+    parser.expr = "(p → q) ⟷ (¬q → ¬p)"
+    parser.parse()
+    print(f"Tautologia: {is_tautology(parser.expression, parser.variables)}")
+
+    parser.expr = "(chuva ∨ irrigação) → grama"
+    parser.parse()
+    print(f"Modelos: {count_models(parser.expression, parser.variables)}")
+    print(f"Probabilidade: {probability(parser.expression, {'chuva': 0.3, 'irrigação': 0.5, 'grama': 0.9}):.4f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,280 @@
+"""
+Resolvedor SAT CDCL (aprendizado de cláusulas dirigido por conflitos) em Python puro.
+Usa dois literais vigiados por cláusula, heurística VSIDS, salvamento de fase e reinícios pela sequência de Luby.
+"""
+
+from __future__ import annotations
+
+import heapq
+from typing import Iterable, Optional
+
+"""Conflitos do primeiro reinício; os seguintes são múltiplos pela sequência de Luby."""
+RESTART_BASE: int = 64
+
+"""Fator de decaimento da atividade das variáveis (VSIDS)."""
+DECAY: float = 0.95
+
+
+def luby(i: int) -> int:
+    """i-ésimo termo (a partir de 1) da sequência de Luby: 1 1 2 1 1 2 4 1 1 2 ..."""
+    size: int = 1
+    while size < i + 1:
+        size = 2 * size + 1
+    while size - 1 != i:
+        size //= 2
+        i %= size
+    return (size + 1) // 2
+
+
+class Solver:
+    """
+    Literais no formato DIMACS: a variável v (de 1 a count) é o literal v e sua negação é -v.
+    Cada cláusula guarda os dois literais vigiados nas posições 0 e 1; em uma cláusula que implicou um literal, ele fica na posição 0.
+    """
+
+    def __init__(self, count: int, clauses: Iterable[Iterable[int]] = ()):
+        self.count: int = count
+        # Listas indexadas pelo literal: -v cai no fim da lista (índice negativo), sem colidir com os positivos
+        # Valor de cada literal: 1 verdade, -1 falso, 0 sem valor
+        self.values: list[int] = [0] * (2 * count + 1)
+        self.levels: list[int] = [0] * (count + 1)
+        self.reasons: list[Optional[list[int]]] = [None] * (count + 1)
+        self.watches: list[list[list[int]]] = [[] for _ in range(2 * count + 1)]
+
+        self.trail: list[int] = []
+        self.limits: list[int] = []
+        self.head: int = 0
+
+        self.activity: list[float] = [0.0] * (count + 1)
+        self.increment: float = 1.0
+        self.heap: list[tuple[float, int]] = [(0.0, v) for v in range(1, count + 1)]
+        self.phase: list[bool] = [False] * (count + 1)
+
+        self.clauses: list[list[int]] = []
+        self.learned: list[list[int]] = []
+        self.conflicts: int = 0
+        self.decisions: int = 0
+        self.unsat: bool = False
+        # Tamanho da trilha no nível 0 na última simplificação
+        self.simplified: int = -1
+
+        for clause in clauses:
+            self.add_clause(clause)
+
+    def value(self, lit: int) -> int:
+        """Valor do literal: 1 verdade, -1 falso, 0 sem valor."""
+        return self.values[lit]
+
+    def add_clause(self, lits: Iterable[int]) -> None:
+        """Adiciona uma cláusula original. Só pode ser chamado no nível 0."""
+        if self.unsat:
+            return
+        clause: list[int] = []
+        for lit in dict.fromkeys(lits):
+            if -lit in clause or self.value(lit) == 1:
+                # Tautologia ou já satisfeita no nível 0
+                return
+            if self.value(lit) == 0:
+                clause.append(lit)
+
+        if not clause:
+            self.unsat = True
+        elif len(clause) == 1:
+            self.enqueue(clause[0], None)
+        else:
+            self.watch(clause)
+            self.clauses.append(clause)
+
+    def watch(self, clause: list[int]) -> None:
+        self.watches[clause[0]].append(clause)
+        self.watches[clause[1]].append(clause)
+
+    def enqueue(self, lit: int, reason: Optional[list[int]]) -> None:
+        """Atribui o literal como verdadeiro no nível atual."""
+        var: int = abs(lit)
+        self.values[lit] = 1
+        self.values[-lit] = -1
+        self.levels[var] = len(self.limits)
+        self.reasons[var] = reason
+        self.trail.append(lit)
+
+    def propagate(self) -> Optional[list[int]]:
+        """Propagação unitária pelos literais vigiados. Retorna a cláusula em conflito ou None."""
+        values, watches, trail = self.values, self.watches, self.trail
+        while self.head < len(trail):
+            false_lit: int = -trail[self.head]
+            self.head += 1
+            watching: list[list[int]] = watches[false_lit]
+            kept: list[list[int]] = []
+            for i, clause in enumerate(watching):
+                if clause[0] == false_lit:
+                    clause[0], clause[1] = clause[1], false_lit
+                first: int = clause[0]
+                first_value: int = values[first]
+                if first_value == 1:
+                    kept.append(clause)
+                    continue
+
+                # Procura outro literal não falso para vigiar no lugar de false_lit
+                for k in range(2, len(clause)):
+                    lit: int = clause[k]
+                    if values[lit] != -1:
+                        clause[1], clause[k] = lit, false_lit
+                        watches[lit].append(clause)
+                        break
+                else:
+                    kept.append(clause)
+                    if first_value == -1:
+                        kept.extend(watching[i + 1:])
+                        watches[false_lit] = kept
+                        return clause
+                    self.enqueue(first, clause)
+            watches[false_lit] = kept
+        return None
+
+    def bump(self, var: int) -> None:
+        """Aumenta a atividade da variável (VSIDS) e a reinsere no heap com a prioridade nova."""
+        self.activity[var] += self.increment
+        if self.activity[var] > 1e100:
+            # Reescala tudo para não estourar o float
+            self.activity = [a * 1e-100 for a in self.activity]
+            self.increment *= 1e-100
+            self.heap = [(-self.activity[v], v) for v in range(1, self.count + 1) if not self.values[v]]
+            heapq.heapify(self.heap)
+        heapq.heappush(self.heap, (-self.activity[var], var))
+
+    def analyze(self, conflict: list[int]) -> tuple[list[int], int]:
+        """
+        Deriva a cláusula aprendida do primeiro ponto de implicação único (1-UIP).
+        Retorna a cláusula, com o literal afirmado na posição 0 e o de maior nível restante na posição 1, e o nível do retrocesso.
+        """
+        levels, reasons, trail = self.levels, self.reasons, self.trail
+        level: int = len(self.limits)
+        seen: set[int] = set()
+        learned: list[int] = [0]
+        pending: int = 0
+        index: int = len(trail) - 1
+        clause: list[int] = conflict
+        lit: int = 0
+        while True:
+            for q in (clause if lit == 0 else clause[1:]):
+                var: int = abs(q)
+                if var not in seen and levels[var] > 0:
+                    seen.add(var)
+                    self.bump(var)
+                    if levels[var] == level:
+                        pending += 1
+                    else:
+                        learned.append(q)
+            # Próximo literal do nível atual marcado, do fim da trilha para o início
+            while abs(trail[index]) not in seen:
+                index -= 1
+            lit = trail[index]
+            index -= 1
+            pending -= 1
+            if pending == 0:
+                break
+            clause = reasons[abs(lit)]
+        learned[0] = -lit
+
+        if len(learned) == 1:
+            return learned, 0
+        deepest: int = max(range(1, len(learned)), key=lambda i: levels[abs(learned[i])])
+        learned[1], learned[deepest] = learned[deepest], learned[1]
+        return learned, levels[abs(learned[1])]
+
+    def backtrack(self, level: int) -> None:
+        """Desfaz as atribuições acima do nível, guardando a fase de cada variável."""
+        if len(self.limits) <= level:
+            return
+        start: int = self.limits[level]
+        for lit in self.trail[start:]:
+            var: int = abs(lit)
+            self.phase[var] = lit > 0
+            self.values[lit] = self.values[-lit] = 0
+            self.reasons[var] = None
+            heapq.heappush(self.heap, (-self.activity[var], var))
+        del self.trail[start:]
+        del self.limits[level:]
+        self.head = len(self.trail)
+
+    def decide(self) -> int:
+        """Variável livre de maior atividade, ou 0 se todas têm valor. Entradas antigas do heap são descartadas."""
+        heap, values = self.heap, self.values
+        while heap:
+            _, var = heapq.heappop(heap)
+            if not values[var]:
+                return var
+        return 0
+
+    def simplify(self) -> None:
+        """
+        No nível 0, após um reinício: remove cláusulas satisfeitas e literais falsos e descarta metade das aprendidas,
+        mantendo as curtas. Os literais vigiados são refeitos. Não faz nada se não houve mudança desde a última vez.
+        """
+        if len(self.trail) == self.simplified and len(self.learned) <= 2000:
+            return
+        self.simplified = len(self.trail)
+
+        def clean(clauses: list[list[int]]) -> list[list[int]]:
+            result: list[list[int]] = []
+            for clause in clauses:
+                if any(self.value(lit) == 1 for lit in clause):
+                    continue
+                result.append([lit for lit in clause if self.value(lit) == 0])
+            return result
+
+        self.clauses = clean(self.clauses)
+        learned: list[list[int]] = sorted(clean(self.learned), key=len)
+        self.learned = learned[:max(len(learned) // 2, 1000)] if len(learned) > 2000 else learned
+
+        self.watches = [[] for _ in range(2 * self.count + 1)]
+        for clause in self.clauses:
+            self.watch(clause)
+        for clause in self.learned:
+            self.watch(clause)
+
+    def solve(self) -> bool:
+        """Procura uma atribuição que satisfaça todas as cláusulas. O modelo fica em model()."""
+        if self.unsat:
+            return False
+        restarts: int = 1
+        limit: int = RESTART_BASE * luby(restarts)
+        since_restart: int = 0
+        while True:
+            conflict: Optional[list[int]] = self.propagate()
+            if conflict is not None:
+                self.conflicts += 1
+                since_restart += 1
+                if not self.limits:
+                    self.unsat = True
+                    return False
+                learned, level = self.analyze(conflict)
+                self.backtrack(level)
+                if len(learned) == 1:
+                    self.enqueue(learned[0], None)
+                else:
+                    self.watch(learned)
+                    self.learned.append(learned)
+                    self.enqueue(learned[0], learned)
+                self.increment /= DECAY
+                continue
+
+            if since_restart >= limit:
+                self.backtrack(0)
+                self.simplify()
+                restarts += 1
+                limit = RESTART_BASE * luby(restarts)
+                since_restart = 0
+                continue
+
+            var: int = self.decide()
+            if not var:
+                return True
+            self.decisions += 1
+            self.limits.append(len(self.trail))
+            self.enqueue(var if self.phase[var] else -var, None)
+
+    def model(self) -> list[bool]:
+        """Valor de cada variável (índice 0 sem uso) após um solve() satisfatível."""
+        return [value == 1 for value in self.values[:self.count + 1]]
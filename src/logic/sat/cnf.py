@@ -0,0 +1,125 @@
+"""
+Codificação de Tseitin: converte uma Expression em CNF equisatisfatível de tamanho linear.
+Cada operador ganha uma variável auxiliar definida por poucas cláusulas; subárvores compartilhadas são codificadas uma vez.
+"""
+
+from __future__ import annotations
+
+from typing import Callable, Iterable, Optional
+
+from logic.model import Expression, postorder, operands
+from logic.model.operators import NOT, AND, OR, IMPLY, EQUAL, XOR, NAND, NOR
+
+
+class CNF:
+    """
+    Cláusulas no formato DIMACS: variáveis são inteiros a partir de 1 e o literal negado é o oposto.
+    As variáveis da expressão vêm primeiro (names), depois as auxiliares.
+    """
+
+    def __init__(self, names: Iterable[str] = ()):
+        self.names: dict[str, int] = {}
+        self.count: int = 0
+        self.clauses: list[list[int]] = []
+        self.true: int = 0
+        for name in names:
+            self.var(name)
+
+    def __len__(self) -> int:
+        return len(self.clauses)
+
+    def new_var(self) -> int:
+        """Cria uma variável auxiliar."""
+        self.count += 1
+        return self.count
+
+    def var(self, name: str) -> int:
+        """Variável da expressão com o nome indicado."""
+        found: Optional[int] = self.names.get(name)
+        if found is None:
+            found = self.names[name] = self.new_var()
+        return found
+
+    def constant(self) -> int:
+        """Literal sempre verdadeiro (uma variável com cláusula unitária), criado na primeira vez que é usado."""
+        if not self.true:
+            self.true = self.new_var()
+            self.add(self.true)
+        return self.true
+
+    def add(self, *lits: int) -> None:
+        self.clauses.append(list(lits))
+
+    def assignment(self, model: list[bool]) -> dict[str, bool]:
+        """Converte um modelo (valor por variável) em atribuição por nome, como a usada por evaluate."""
+        return {name: model[var] for name, var in self.names.items()}
+
+    def to_dimacs(self) -> str:
+        """Texto no formato DIMACS CNF, aceito por outros resolvedores."""
+        lines: list[str] = [f"p cnf {self.count} {len(self.clauses)}"]
+        lines.extend(" ".join(map(str, clause)) + " 0" for clause in self.clauses)
+        return "\n".join(lines) + "\n"
+
+
+def define_and(cnf: CNF, *lits: int) -> int:
+    """x ⟷ (a1 ∧ ... ∧ an): (¬x ∨ ai) para cada i e (x ∨ ¬a1 ∨ ... ∨ ¬an)."""
+    x: int = cnf.new_var()
+    for lit in lits:
+        cnf.add(-x, lit)
+    cnf.add(x, *(-lit for lit in lits))
+    return x
+
+
+def define_or(cnf: CNF, *lits: int) -> int:
+    """a1 ∨ ... ∨ an == ¬(¬a1 ∧ ... ∧ ¬an)."""
+    return -define_and(cnf, *(-lit for lit in lits))
+
+
+def define_equal(cnf: CNF, a: int, b: int) -> int:
+    """x ⟷ (a ⟷ b), com quatro cláusulas."""
+    x: int = cnf.new_var()
+    cnf.add(-x, -a, b)
+    cnf.add(-x, a, -b)
+    cnf.add(x, a, b)
+    cnf.add(x, -a, -b)
+    return x
+
+
+"""Literal de cada operador a partir dos literais das subexpressões. Negações não criam variáveis."""
+encoders: dict[type, Callable[..., int]] = {
+    NOT: lambda cnf, a: -a,
+    AND: define_and,
+    OR: define_or,
+    IMPLY: lambda cnf, a, b: define_or(cnf, -a, b),
+    EQUAL: define_equal,
+    XOR: lambda cnf, a, b: -define_equal(cnf, a, b),
+    NAND: lambda cnf, *lits: -define_and(cnf, *lits),
+    NOR: lambda cnf, *lits: -define_or(cnf, *lits),
+}
+
+
+def encode(cnf: CNF, expr: Expression) -> int:
+    """Adiciona as definições da expressão à CNF, de baixo para cima e sem recursão. Retorna o literal da raiz."""
+    lits: dict[int, int] = {}
+    for node in postorder(expr):
+        if node.type == operands.VAR:
+            lit: int = cnf.var(node.var)
+        elif node.type == operands.TRUE:
+            lit = cnf.constant()
+        elif node.type == operands.FALSE:
+            lit = -cnf.constant()
+        elif node.type in encoders:
+            lit = encoders[node.type](cnf, *(lits[id(child)] for child in node.children))
+        else:
+            raise TypeError(f"{type(node).__name__} não pode ser convertido para CNF.")
+        lits[id(node)] = lit
+    return lits[id(expr)]
+
+
+def tseitin(expr: Expression, variables: dict[str, bool] = None) -> CNF:
+    """CNF satisfatível exatamente quando a expressão é. As variáveis indicadas entram mesmo que não apareçam."""
+    names: list[str] = list(variables) if variables is not None else []
+    names.extend(var for var in expr.variables() if var not in names)
+    cnf: CNF = CNF(names)
+    cnf.add(encode(cnf, expr))
+    return cnf
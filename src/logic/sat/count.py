@@ -0,0 +1,153 @@
+"""
+Contagem de modelos (#SAT) e contagem ponderada sem enumerar as linhas da tabela verdade.
+Sobre a CNF de Tseitin: propaga unitários, separa as cláusulas em componentes independentes (o resultado é o produto)
+e guarda o valor de cada componente em cache, então subproblemas repetidos são calculados uma vez.
+"""
+
+from __future__ import annotations
+
+from typing import Iterable, Optional
+
+
+class Counter:
+    """
+    Conta modelos ponderados de cláusulas DIMACS sobre as variáveis 1..count.
+    weights é indexado pelo literal (-v cai no fim da lista, como no Solver); um modelo vale o produto dos pesos de seus literais.
+    Só as variáveis 1..inputs são escolhidas para ramificar; as demais (auxiliares de Tseitin) são definidas por elas.
+    """
+
+    def __init__(self, count: int, clauses: Iterable[Iterable[int]], weights: list, inputs: Optional[int] = None):
+        self.count: int = count
+        self.clauses: list[tuple[int, ...]] = [tuple(sorted(set(clause))) for clause in clauses]
+        self.weights: list = weights
+        self.inputs: int = count if inputs is None else inputs
+        self.cache: dict[frozenset[tuple[int, ...]], object] = {}
+
+    def propagate(self, clauses: list[tuple[int, ...]], assumptions: Iterable[int]) -> Optional[tuple[set[int], list]]:
+        """Atribui as suposições e os unitários até não haver mais. Retorna (literais atribuídos, cláusulas restantes) ou None em conflito."""
+        occurs: dict[int, list[int]] = {}
+        sizes: list[int] = []
+        queue: list[int] = list(assumptions)
+        for i, clause in enumerate(clauses):
+            if not clause:
+                return None
+            if len(clause) == 1:
+                queue.append(clause[0])
+            sizes.append(len(clause))
+            for lit in clause:
+                occurs.setdefault(lit, []).append(i)
+
+        assigned: set[int] = set()
+        satisfied: list[bool] = [False] * len(clauses)
+        while queue:
+            lit: int = queue.pop()
+            if lit in assigned:
+                continue
+            if -lit in assigned:
+                return None
+            assigned.add(lit)
+            for i in occurs.get(lit, ()):
+                satisfied[i] = True
+            for i in occurs.get(-lit, ()):
+                if satisfied[i]:
+                    continue
+                sizes[i] -= 1
+                if sizes[i] == 0:
+                    return None
+                if sizes[i] == 1:
+                    queue.append(next(q for q in clauses[i] if -q not in assigned))
+
+        rest: list[tuple[int, ...]] = [tuple(q for q in clause if -q not in assigned)
+                                       for i, clause in enumerate(clauses) if not satisfied[i]]
+        return assigned, rest
+
+    @staticmethod
+    def components(clauses: list[tuple[int, ...]]) -> list[list[tuple[int, ...]]]:
+        """Separa as cláusulas em grupos sem variáveis em comum."""
+        by_var: dict[int, list[int]] = {}
+        for i, clause in enumerate(clauses):
+            for lit in clause:
+                by_var.setdefault(abs(lit), []).append(i)
+        seen: list[bool] = [False] * len(clauses)
+        groups: list[list[tuple[int, ...]]] = []
+        for start in range(len(clauses)):
+            if seen[start]:
+                continue
+            seen[start] = True
+            group: list[int] = [start]
+            for i in group:
+                for lit in clauses[i]:
+                    for j in by_var.pop(abs(lit), ()):
+                        if not seen[j]:
+                            seen[j] = True
+                            group.append(j)
+            groups.append([clauses[i] for i in group])
+        return groups
+
+    def branch_var(self, clauses: list[tuple[int, ...]]) -> int:
+        """
+        Variável de entrada que aparece em mais cláusulas do componente (qualquer uma, se não houver de entrada).
+        No empate, a mais próxima do meio da ordem de aparição: em fórmulas encadeadas ela tende a partir o componente ao meio.
+        """
+        occurrences: dict[int, int] = {}
+        for clause in clauses:
+            for lit in clause:
+                occurrences[abs(lit)] = occurrences.get(abs(lit), 0) + 1
+        inputs: list[int] = sorted(var for var in occurrences if var <= self.inputs) or sorted(occurrences)
+        middle: int = len(inputs)
+        return inputs[max(range(len(inputs)), key=lambda i: (occurrences[inputs[i]], -abs(2 * i - middle)))]
+
+    def run(self):
+        """
+        Soma ponderada dos modelos, sem recursão. A pilha de tarefas tem:
+        ("count", cláusulas, escopo, suposições), ("branch", componente), ("cache", componente) e ("product", fator, quantidade).
+        Cada count e branch deixa um valor na pilha de valores; cache soma os dois ramos e product multiplica os componentes.
+        """
+        weights, cache = self.weights, self.cache
+        tasks: list[tuple] = [("count", self.clauses, set(range(1, self.count + 1)), ())]
+        values: list = []
+        while tasks:
+            task: tuple = tasks.pop()
+            if task[0] == "count":
+                _, clauses, scope, assumptions = task
+                propagated: Optional[tuple[set[int], list]] = self.propagate(clauses, assumptions)
+                if propagated is None:
+                    values.append(0)
+                    continue
+                assigned, rest = propagated
+                factor = 1
+                for lit in assigned:
+                    factor *= weights[lit]
+                # Variáveis do escopo que sumiram das cláusulas sem receber valor são livres
+                remaining: set[int] = {abs(lit) for clause in rest for lit in clause}
+                for var in scope - remaining - {abs(lit) for lit in assigned}:
+                    factor *= weights[var] + weights[-var]
+                pending: list[frozenset] = []
+                for group in self.components(rest):
+                    key: frozenset[tuple[int, ...]] = frozenset(group)
+                    found = cache.get(key)
+                    if found is None:
+                        pending.append(key)
+                    else:
+                        factor *= found
+                tasks.append(("product", factor, len(pending)))
+                tasks.extend(("branch", key) for key in pending)
+            elif task[0] == "branch":
+                key = task[1]
+                clauses = list(key)
+                var: int = self.branch_var(clauses)
+                scope = {abs(lit) for clause in clauses for lit in clause}
+                tasks.append(("cache", key))
+                tasks.append(("count", clauses, scope, (-var,)))
+                tasks.append(("count", clauses, scope, (var,)))
+            elif task[0] == "cache":
+                # Os dois ramos da variável escolhida
+                value = values.pop() + values.pop()
+                cache[task[1]] = value
+                values.append(value)
+            else:
+                _, factor, length = task
+                for _ in range(length):
+                    factor *= values.pop()
+                values.append(factor)
+        return values.pop()
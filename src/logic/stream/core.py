@@ -1,8 +1,10 @@
+import bisect
+import re
 from enum import Enum
-from typing import Callable
+from typing import Callable, Iterator
 
 from logic.stream.exceptions import BadToken, FullBuffer
-from wordtree import WordTree, PrefixNode
+from wordtree import WordTree
 
 
 def reverse_map(sample_dict: dict) -> dict:
@@ -49,19 +51,45 @@ logic_map: dict[Logic, list[str]] = {
     Logic.NOR: ['NOR', '↓'],
     Logic.OPEN: ['('],
     Logic.CLOSE: [')'],
-    Logic.VAR: ['p', 'q', 'r'],
 }
 
 logic_map[Logic.CONSTANT] = logic_map[Logic.TRUE] + logic_map[Logic.FALSE]
 
+
+def is_name_start(ch: str) -> bool:
+    """Identificadores começam com uma letra ou '_'."""
+    return ch.isalpha() or ch == "_"
+
+
 # Utilizado para facilitar procuras
 whitespace: tuple = (' ', '\n', '\t')
 equivalent: dict[str, Logic] = reverse_map(logic_map)
 operators = (key for key, val in equivalent.items() if val != Logic.CONSTANT)
-word_tree: WordTree = WordTree()
 
-for word in equivalent:
-    word_tree.add(word)
+"""Palavras reservadas (constantes e operadores escritos com letras); qualquer outro identificador é uma variável."""
+keywords: dict[str, Logic] = {word: kind for word, kind in equivalent.items() if is_name_start(word[0])}
+
+"""Tokens escritos com símbolos, do maior para o menor: a primeira alternativa que casa é a mais longa ('&&' antes de '&')."""
+symbols: list[str] = sorted((word for word in equivalent if word not in keywords), key=len, reverse=True)
+
+"""
+Todos os tokens em uma única expressão regular, compilada uma vez: espaços antes do token e então um identificador ou símbolo.
+O texto é percorrido uma vez, sem devolver caracteres.
+"""
+token_pattern: re.Pattern = re.compile(
+    f"[{''.join(map(re.escape, whitespace))}]*"
+    r"([^\W\d]\w*"
+    f"|{'|'.join(map(re.escape, symbols))})"
+)
+
+"""Tipo e valor do token de cada palavra reservada e símbolo; constantes são guardadas como 'V' ou 'F'."""
+lexemes: dict[str, tuple[Logic, str]] = {
+    word: (kind, ("V" if word in logic_map[Logic.TRUE] else "F") if kind == Logic.CONSTANT else word)
+    for word, kind in equivalent.items()
+}
+
+"""Todas as palavras e símbolos com seu (tipo, valor), para autocompletar e buscas por prefixo."""
+word_tree: WordTree = WordTree.build(lexemes.items())
 
 
 class ReturnString:
@@ -77,6 +105,8 @@ class ReturnString:
 class Token:
     """Representa um elemento lógico dentro de uma expressão."""
 
+    __slots__ = ("kind", "value")
+
     def __init__(self, kind: Logic = Logic.EOF, value: str = ""):
         self.kind: Logic = kind
         self.value = value
@@ -99,52 +129,146 @@ class Token:
 
 
 class InputStream:
-    """Nesse Stream se obtem caracteres separados pelo espaço em branco."""
+    """Nesse Stream se obtem caracteres separados pelo espaço em branco. Usa um cursor sobre o texto original."""
 
     def __init__(self, source: Callable = input):
         self.source: Callable = source
         self.buffer: str = ""
+        self.index: int = 0
 
     def __bool__(self) -> bool:
-        return bool(self.buffer)
+        return self.index < len(self.buffer)
 
     def get(self) -> str:
         """Retorna um caracter."""
         return self.char_tokenize()
 
     def putback(self, val: str) -> None:
-        """Retorna o caracter para o buffer"""
-        self.buffer = val + self.buffer
+        """Retorna o caracter para o buffer. Se val foram os últimos caracteres lidos, apenas volta o cursor."""
+        index: int = self.index
+        for char in reversed(val):
+            index -= 1
+            while index >= 0 and self.buffer[index] in whitespace:
+                index -= 1
+            if index < 0 or self.buffer[index] != char:
+                # Não veio deste buffer; recomeça o texto a partir de val
+                self.buffer = val + self.buffer[self.index:]
+                self.index = 0
+                return
+        self.index = index
 
     def input(self) -> None:
         """Utiliza o source para pegar um input."""
         self.buffer = self.source()
+        self.index = 0
 
     def empty(self) -> bool:
         """Verfifica se acabou o buffer."""
-        return len(self.buffer) <= 0
+        return self.index >= len(self.buffer)
 
     def char_tokenize(self) -> str:
         """Pega o primeiro caracter que não seja um espaço branco."""
-        index: int = 0
+        index: int = self.index
         size: int = len(self.buffer)
-        value: str = ""
-        if self.buffer:
-            # Andar o cursor até primeiro caractere não espaço em branco
-            while index < size and self.buffer[index] in whitespace:
-                index += 1
 
-            while index < size and self.buffer[index] not in whitespace:
-                value = self.buffer[index]
-                self.buffer = self.buffer[index + 1:]
-                return value
-            self.buffer = self.buffer[index + 1:]
-
-        return value
+        # Andar o cursor até primeiro caractere não espaço em branco
+        while index < size and self.buffer[index] in whitespace:
+            index += 1
+
+        if index < size:
+            self.index = index + 1
+            return self.buffer[index]
+
+        self.index = size
+        return ""
+
+
+def to_token(word: str) -> Token:
+    """Token de uma palavra encontrada por token_pattern: palavra reservada, símbolo ou variável."""
+    found: tuple[Logic, str] = lexemes.get(word)
+    if found is None:
+        return Token(Logic.VAR, word)
+    return Token(*found)
+
+
+def bad_token(text: str, index: int) -> BadToken:
+    """Erro para o primeiro caractere, a partir de index, que não inicia nenhum token."""
+    for match in token_pattern.finditer(text, index):
+        if match.start() != index:
+            break
+        index = match.end()
+    while text[index] in whitespace:
+        index += 1
+    return BadToken(f"Caractere inválido='{text[index]}'")
+
+
+def scan(text: str, index: int = 0) -> list[Token]:
+    """
+    Tokens de text a partir de index, em uma única passada; cada um é a correspondência mais longa. Não inclui o EOF.
+    Se algum caractere não inicia token, findall o pula: a soma dos tamanhos não fecha e é gerado BadToken.
+    """
+    words: list[str] = token_pattern.findall(text, index)
+    blanks: int = sum(text.count(space, index) for space in whitespace)
+    if blanks + sum(map(len, words)) != len(text) - index:
+        raise bad_token(text, index)
+    return [to_token(word) for word in words]
+
+
+def read_token(text: str, index: int) -> tuple[Token, int]:
+    """Lê um token a partir de text[index]. Retorna o token e a posição logo após ele; no fim do texto, um EOF."""
+    match: re.Match = token_pattern.match(text, index)
+    if match is None:
+        if text[index:].strip(''.join(whitespace)):
+            raise bad_token(text, index)
+        return Token(), len(text)
+    return to_token(match.group(1)), match.end()
+
+
+def iter_tokens(text: str, index: int = 0) -> Iterator[tuple[Token, int]]:
+    """Como scan, mas gera (token, posição logo após ele) sob demanda. Caracteres que não iniciam token geram BadToken."""
+    for match in token_pattern.finditer(text, index):
+        if match.start() != index:
+            raise bad_token(text, index)
+        index = match.end()
+        yield to_token(match.group(1)), index
+    if text[index:].strip(''.join(whitespace)):
+        raise bad_token(text, index)
+
+
+def rescan(old: str, tokens: list[Token], ends: list[int], text: str) -> tuple[list[Token], list[int]]:
+    """
+    Tokens de text reaproveitando os de old (sem EOF), cujas posições finais estão em ends. Retorna os tokens e as posições novas.
+    Os tokens que terminam antes da edição (com folga de um símbolo, que poderia ficar mais longo) são mantidos.
+    A leitura recomeça no fim do último mantido e para no primeiro token depois da edição que termina onde terminava um token de old:
+    dali em diante o texto é o mesmo, então os tokens também são.
+    """
+    size: int = min(len(old), len(text))
+    start: int = 0
+    while start < size and old[start] == text[start]:
+        start += 1
+    same: int = 0
+    while same < size - start and old[-1 - same] == text[-1 - same]:
+        same += 1
+    delta: int = len(text) - len(old)
+    edited: int = len(text) - same
+
+    keep: int = bisect.bisect_right(ends, start - len(symbols[0]))
+    result: list[Token] = tokens[:keep]
+    positions: list[int] = ends[:keep]
+    for token, end in iter_tokens(text, positions[-1] if positions else 0):
+        result.append(token)
+        positions.append(end)
+        if end >= edited:
+            i: int = bisect.bisect_left(ends, end - delta)
+            if i < len(ends) and ends[i] == end - delta:
+                result.extend(tokens[i + 1:])
+                positions.extend(position + delta for position in ends[i + 1:])
+                break
+    return result, positions
 
 
 class TokenStream:
-    """Utiliza um InputStream para separar os tokens de uma string."""
+    """Utiliza um InputStream para separar os tokens de uma string. Lê direto do texto do InputStream, sem devolver caracteres."""
 
     def __init__(self, source: InputStream):
         self.source = source
@@ -154,52 +278,22 @@ class TokenStream:
     def tokenize(self) -> list[Token]:
         """Retorna uma lista com os Tokens permitidos. Finaliza com um EOF (End-of-File)."""
         tokens: list[Token] = []
-        t: Token = self.get()
-        while t:
-            tokens.append(t)
-            t = self.get()
+        if self.full:
+            tokens.append(self.get())
+        tokens.extend(scan(self.source.buffer, self.source.index))
+        self.source.index = len(self.source.buffer)
 
         tokens.append(Token(Logic.EOF))
         return tokens
 
-    def match(self, ch: str) -> str:
-        """Procura uma aproximação a partir de 1 caractere."""
-        node: PrefixNode = word_tree.root
-        matched: str = ""
-        while node.has(ch):
-            node = node.get(ch)
-            matched += ch
-            ch = self.source.get()
-        self.source.putback(ch)
-
-        return matched
-
     def get(self) -> Token:
-        """Retorna somente um Token permitido. Utilizando uma Arvore de Palavras para se aproximar."""
+        """Retorna somente um Token permitido, a correspondência mais longa na posição atual."""
         if self.full:
             self.full = False
             return self.buffer
 
-        ch: str = self.source.get()
-
-        if ch in logic_map[Logic.TRUE]:
-            return Token(equivalent[ch], "V")
-
-        elif ch in logic_map[Logic.FALSE]:
-            return Token(equivalent[ch], "F")
-
-        elif word_tree.root.has(ch):
-            match: str = self.match(ch)
-            if match in equivalent:
-                return Token(equivalent[match], match)
-
-            # Caso não tenha match; retornar string para o buffer
-            self.source.putback(match)
-
-        elif ch == "":
-            return Token()
-
-        raise BadToken(f"Caractere inválido='{ch}'")
+        t, self.source.index = read_token(self.source.buffer, self.source.index)
+        return t
 
     def putback(self, t: Token) -> None:
         """Retorna um Token para o buffer."""
@@ -219,10 +313,10 @@ def main() -> None:
     cin = InputStream(text_stream)
     ts = TokenStream(cin)
 
-    text_stream.text = "OU"
-    print(word_tree.root.children["O"])
+    text_stream.text = "en_42 OU ready_q -> p"
+    print(word_tree.longest_match(text_stream.text, 17))
     cin.input()
-    print(ts.match("OU"))
+    print(ts.tokenize())
 
 
 if __name__ == '__main__':
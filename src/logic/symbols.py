@@ -0,0 +1,54 @@
+"""
+Tabela de símbolos: associa cada nome de variável a um id inteiro denso (0, 1, 2, ...).
+Avaliadores e tabelas indexam listas pelo id, sem procurar strings em dicionários a cada linha.
+"""
+
+from __future__ import annotations
+
+from typing import Iterable, Iterator, Optional
+
+
+class SymbolTable:
+    """Nomes na ordem em que foram adicionados; o id de um nome é sua posição."""
+
+    def __init__(self, names: Iterable[str] = ()):
+        self.names: list[str] = []
+        self.ids: dict[str, int] = {}
+        for name in names:
+            self.add(name)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.names)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.ids
+
+    def __getitem__(self, name: str) -> int:
+        return self.ids[name]
+
+    def __repr__(self) -> str:
+        return f"SymbolTable({self.names})"
+
+    def add(self, name: str) -> int:
+        """Retorna o id do nome, criando um novo caso seja desconhecido."""
+        found: Optional[int] = self.ids.get(name)
+        if found is None:
+            found = self.ids[name] = len(self.names)
+            self.names.append(name)
+        return found
+
+    def name(self, i: int) -> str:
+        """Retorna o nome do id."""
+        return self.names[i]
+
+    def pack(self, values: dict[str, object], default: object = None) -> list:
+        """Converte um mapa por nome em uma lista indexada pelo id. Nomes ausentes recebem default."""
+        return [values.get(name, default) for name in self.names]
+
+    @classmethod
+    def sorted(cls, variables: Iterable[str]) -> SymbolTable:
+        """Tabela com os nomes em ordem alfabética, a ordem das colunas das tabelas verdade."""
+        return cls(sorted(variables))
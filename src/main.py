@@ -1,4 +1,5 @@
 from logic.calculator.parser import LogicParser
+from logic.calculator.session import Session
 from logic.calculator.table import TruthTable
 from logic.stream.core import logic_map, Logic
 
@@ -15,7 +16,7 @@ def header() -> None:
     print("[ Calculadora Lógica ]".center(size, '-'))
     print("Constantes: ")
     print(f"TRUE = {logic_map[Logic.TRUE]}\nFALSE = {logic_map[Logic.FALSE]}")
-    print(f"VAR = {logic_map[Logic.VAR]}")
+    print("VAR = letras, dígitos e '_', começando por letra ou '_' (ex.: p, en_42, ready_q)")
     print("-" * 20)
     print("Operadores Unários: ")
     print(f"NOT = {logic_map[Logic.NOT]}")
@@ -58,17 +59,18 @@ def main() -> None:
     print()
 
     errors: list[Exception] = []
-    parser: LogicParser = LogicParser(normalize=ONLY_CANON, simplify_expression=SIMPLIFY)
+    # Guarda tokens, expressão e coluna da linha anterior; cada linha só recalcula o que mudou
+    session: Session = Session(normalize=ONLY_CANON, simplify_expression=SIMPLIFY)
+    parser: LogicParser = session.parser
     while True:
-        parser.expr = input("> ")
         try:
-            parser.parse()
+            session.update(input("> "))
         except (ParseError, BadToken) as e:
             errors.append(e)
 
         print(f"Fórmula Válida: {parser.is_valid()}")
         if parser.is_valid():
-            table: TruthTable = parser.get_table()
+            table: TruthTable = session.table()
             print(f"Fórmula Canônica: {parser.is_canon()}")
             table.show()
 
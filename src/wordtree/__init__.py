@@ -1,15 +1,21 @@
 from __future__ import annotations
 
+from typing import Iterable, Iterator, Optional
+
 
 class PrefixNode:
-    """Representa um prefixo em uma arvore de prefixos."""
+    """Representa um prefixo em uma arvore de prefixos. terminal indica que o prefixo é uma palavra inteira, com valor value."""
+
+    __slots__ = ("char", "children", "terminal", "value")
 
     def __init__(self, char: str):
         self.char: str = char
         self.children: dict[str, PrefixNode] = {}
+        self.terminal: bool = False
+        self.value = None
 
     def __repr__(self) -> str:
-        return f"CharNode(char='{self.char}', children={self.children})"
+        return f"CharNode(char='{self.char}', terminal={self.terminal}, children={self.children})"
 
     def __eq__(self, other) -> bool:
         return self.char == other
@@ -26,46 +32,131 @@ class PrefixNode:
     def set(self, char: str, node) -> None:
         self.children[char] = node
 
+    def child(self, char: str) -> PrefixNode:
+        """Retorna o filho do caractere, criando-o caso não exista."""
+        node: Optional[PrefixNode] = self.children.get(char)
+        if node is None:
+            node = self.children[char] = PrefixNode(char)
+        return node
+
 
 class WordTree:
-    """Representa uma arvore de prefixos e guarda sua raiz."""
+    """
+    Representa uma arvore de prefixos e guarda sua raiz.
+    Cada palavra termina em um nó terminal que guarda um valor associado (por exemplo, o tipo do token).
+    """
 
-    def __init__(self):
+    def __init__(self, words: Iterable[str] = ()):
         self.root: PrefixNode = PrefixNode("")
-
-    def add(self, word: str) -> None:
+        self.size: int = 0
+        for word in words:
+            self.add(word)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __contains__(self, word: str) -> bool:
+        return self.find(word)
+
+    @classmethod
+    def build(cls, items: Iterable[tuple[str, object]]) -> WordTree:
+        """
+        Constroi a árvore de uma vez a partir de pares (palavra, valor).
+        As palavras são ordenadas; cada uma reaproveita o caminho do prefixo em comum com a anterior, sem descer da raiz.
+        """
+        tree: WordTree = cls()
+        path: list[PrefixNode] = [tree.root]
+        previous: str = ""
+        for word, value in sorted(items, key=lambda item: item[0]):
+            common: int = 0
+            limit: int = min(len(word), len(previous))
+            while common < limit and word[common] == previous[common]:
+                common += 1
+            del path[common + 1:]
+            for char in word[common:]:
+                path.append(path[-1].child(char))
+            tree.mark(path[-1], value)
+            previous = word
+        return tree
+
+    def mark(self, node: PrefixNode, value) -> None:
+        """Marca o nó como fim de palavra com o valor indicado."""
+        if not node.terminal:
+            node.terminal = True
+            self.size += 1
+        node.value = value
+
+    def add(self, word: str, value=None) -> None:
+        """Adiciona a palavra com o valor associado; se já existir, substitui o valor."""
         node: PrefixNode = self.root
         for char in word:
-            found: bool = False
-            if node.has(char):
-                node = node.get(char)
-                found = True
-            if not found:
-                new_node: PrefixNode = PrefixNode(char)
-                node.set(char, new_node)
-                node = new_node
+            node = node.child(char)
+        self.mark(node, value)
+
+    def node(self, prefix: str) -> Optional[PrefixNode]:
+        """Retorna o nó do prefixo ou None caso nenhuma palavra comece com ele."""
+        node: PrefixNode = self.root
+        for char in prefix:
+            node = node.children.get(char)
+            if node is None:
+                return None
+        return node
 
     def find(self, word: str) -> bool:
+        """Verifica se a palavra inteira foi adicionada (não apenas um prefixo)."""
+        node: Optional[PrefixNode] = self.node(word)
+        return node is not None and node.terminal
+
+    def get(self, word: str, default=None):
+        """Retorna o valor da palavra ou default caso não exista."""
+        node: Optional[PrefixNode] = self.node(word)
+        if node is None or not node.terminal:
+            return default
+        return node.value
+
+    def longest_match(self, text: str, pos: int = 0) -> Optional[tuple[str, object]]:
+        """
+        Maior palavra da árvore que começa em text[pos], percorrendo o texto uma vez e sem voltar caracteres.
+        Retorna (palavra, valor) ou None caso nenhuma palavra comece nessa posição.
+        """
         node: PrefixNode = self.root
-        if not node.children:
-            return False
-        for char in word:
-            found: bool = False
-            if node.has(char):
-                found = True
-                node = node.get(char)
-            if not found:
-                return False
-        return True
+        found: Optional[PrefixNode] = None
+        end: int = pos
+        index: int = pos
+        size: int = len(text)
+        while index < size:
+            node = node.children.get(text[index])
+            if node is None:
+                break
+            index += 1
+            if node.terminal:
+                found, end = node, index
+        if found is None:
+            return None
+        return text[pos:end], found.value
+
+    def words(self, prefix: str = "") -> Iterator[str]:
+        """Palavras que começam com o prefixo, em ordem alfabética (útil para autocompletar)."""
+        start: Optional[PrefixNode] = self.node(prefix)
+        if start is None:
+            return
+        stack: list[tuple[PrefixNode, str]] = [(start, prefix)]
+        while stack:
+            node, word = stack.pop()
+            if node.terminal:
+                yield word
+            for char in sorted(node.children, reverse=True):
+                stack.append((node.children[char], word + char))
+
 
 def main() -> None:
-    root: WordTree = WordTree()
-    root.add("OR")
-    root.add('OU')
+    root: WordTree = WordTree.build([("OR", "disjunção"), ("OU", "disjunção"), ("->", "implicação")])
 
     print(root.find("OU"))
-    print(root.find("OR"))
+    print(root.find("O"))
     print(root.find("&&"))
+    print(root.longest_match("p -> q", 2))
+    print(list(root.words("O")))
 
 
 if __name__ == '__main__':